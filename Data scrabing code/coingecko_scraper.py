@@ -1,10 +1,26 @@
+import atexit
 import csv
+import io
 import os
+import re
+import threading
 import time
+from bisect import bisect_right
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 COINGECKO_HEADERS = [
@@ -35,13 +51,89 @@ COINGECKO_HEADERS = [
     "cg_homepage",
 ]
 
+# Extracted CoinGecko values, in the same order as the cg_* columns of COINGECKO_HEADERS.
+CgRow = namedtuple(
+    "CgRow",
+    [
+        "name",
+        "symbol",
+        "price_usd",
+        "market_cap",
+        "market_cap_rank",
+        "fdv",
+        "total_volume",
+        "high_24h",
+        "low_24h",
+        "price_change_pct_24h",
+        "mc_change_24h",
+        "mc_change_pct_24h",
+        "circulating_supply",
+        "total_supply",
+        "max_supply",
+        "ath",
+        "ath_change_pct",
+        "ath_date",
+        "atl",
+        "atl_change_pct",
+        "atl_date",
+        "homepage",
+    ],
+)
+
+# Shared row for tokens CoinGecko has no data for; namedtuples are immutable so one instance is enough.
+_NA_CG_ROW = CgRow(*("NA",) * len(CgRow._fields))
+
+
+def _json(response: requests.Response):
+    """Decode a JSON body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+# gzip/deflate, plus br/zstd when their decoders are installed.
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
+# CoinGecko free tier allows roughly 30 requests per minute.
+CYCLE_SECONDS = 17
+FLUSH_SECONDS = 60
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by every fetch in a polling cycle."""
+
+    def __init__(self, rate: float = 0.5, capacity: int = 5) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
 
 class CoinGeckoClient:
     """Client for CoinGecko contract data (Solana network)."""
 
     BASE_URL = "https://api.coingecko.com/api/v3/coins/solana/contract/{contract}"
-
-    def __init__(self) -> None:
+    MARKETS_URL = "https://api.coingecko.com/api/v3/coins/markets"
+    # CoinGecko refreshes its market data roughly once a minute.
+    CACHE_TTL = 45.0
+
+    def __init__(self, rate_limiter: Optional[TokenBucket] = None) -> None:
+        self.rate_limiter = rate_limiter
+        self._cache: Dict[str, Tuple[float, object]] = {}
+        self._etags: Dict[str, str] = {}
         self.session = requests.Session()
         self.session.headers.update(
             {
@@ -50,186 +142,240 @@ class CoinGeckoClient:
                     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
                 ),
                 "Accept": "application/json",
+                "Accept-Encoding": ACCEPT_ENCODING,
+                "Connection": "keep-alive",
             }
         )
-
-    def fetch(self, contract_address: str) -> Optional[Dict]:
-        url = self.BASE_URL.format(contract=contract_address.strip())
-        try:
-            response = self.session.get(url, timeout=20)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504]),
+        )
+        self.session.mount("https://", adapter)
+
+    def _get_json(self, key: str, url: str, params: Optional[Dict] = None) -> Tuple[object, bool]:
+        """GET a JSON body, serving it from cache while fresh and revalidating with the ETag after.
+
+        Returns (data, fresh); fresh is False for a cache hit or a 304, where the data is unchanged.
+        """
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] <= self.CACHE_TTL:
+            return cached[1], False
+        headers = None
+        etag = self._etags.get(key)
+        if cached is not None and etag:
+            headers = {"If-None-Match": etag}
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        response = self.session.get(url, params=params, headers=headers, timeout=20)
+        fresh = not (response.status_code == 304 and cached is not None)
+        if not fresh:
+            data = cached[1]
+        else:
             response.raise_for_status()
-            return response.json()
+            data = _json(response)
+            etag = response.headers.get("ETag")
+            if etag:
+                self._etags[key] = etag
+        self._cache[key] = (time.monotonic(), data)
+        return data, fresh
+
+    def fetch(self, contract_address: str) -> Tuple[Optional[Dict], bool]:
+        """Return (report, fresh) for a contract; fresh is False when CoinGecko has nothing new."""
+        contract = contract_address.strip()
+        try:
+            return self._get_json(contract, self.BASE_URL.format(contract=contract))
         except requests.RequestException as exc:
             print(f"[warn] {contract_address}: coingecko request failed: {exc}")
         except ValueError:
             print(f"[warn] {contract_address}: coingecko invalid JSON")
-        return None
+        return None, False
 
+    def fetch_markets(self, coin_ids: List[str]) -> Tuple[Dict[str, Dict], bool]:
+        """Fetch market data for many coins in one request, keyed by CoinGecko coin id, plus its freshness."""
+        ids = ",".join(coin_ids)
+        params = {"vs_currency": "usd", "ids": ids, "per_page": 250}
+        try:
+            entries, fresh = self._get_json(f"markets:{ids}", self.MARKETS_URL, params)
+        except requests.RequestException as exc:
+            print(f"[warn] coingecko markets request failed: {exc}")
+            return {}, False
+        except ValueError:
+            print("[warn] coingecko markets invalid JSON")
+            return {}, False
+        if not isinstance(entries, list):
+            return {}, False
+        return {entry["id"]: entry for entry in entries if isinstance(entry, dict) and "id" in entry}, fresh
 
-def _safe_get(data: Dict, default="NA", *keys):
-    current = data
-    for key in keys:
-        if not isinstance(current, dict):
-            return default
-        current = current.get(key, default)
-    return default if current is None else current
 
+# Value buckets split at these thresholds, each with its (divisor, template).
+_MONEY_BOUNDS = (1_000, 1_000_000, 1_000_000_000)
+_MONEY_FORMATS = ((1, "${:.2f}"), (1_000, "${:.2f}K"), (1_000_000, "${:.2f}M"), (1_000_000_000, "${:.2f}B"))
+_NUMBER_BOUNDS = (1_000_000, 1_000_000_000)
+_NUMBER_FORMATS = ((1, "{:,.0f}"), (1_000_000, "{:.2f}M"), (1_000_000_000, "{:.2f}B"))
 
-def extract_coingecko_fields(data: Optional[Dict]) -> Dict[str, str]:
-    if not data:
-        return {
-            "name": "NA",
-            "symbol": "NA",
-            "price_usd": "NA",
-            "market_cap": "NA",
-            "market_cap_rank": "NA",
-            "fdv": "NA",
-            "total_volume": "NA",
-            "high_24h": "NA",
-            "low_24h": "NA",
-            "price_change_pct_24h": "NA",
-            "mc_change_24h": "NA",
-            "mc_change_pct_24h": "NA",
-            "circulating_supply": "NA",
-            "total_supply": "NA",
-            "max_supply": "NA",
-            "ath": "NA",
-            "ath_change_pct": "NA",
-            "ath_date": "NA",
-            "atl": "NA",
-            "atl_change_pct": "NA",
-            "atl_date": "NA",
-            "homepage": "NA",
-        }
-
-    def fmt_pct(val):
-        if val in ("NA", None):
-            return "NA"
-        try:
-            return f"{float(val):.2f}%"
-        except (TypeError, ValueError):
-            return "NA"
 
-    def fmt_price(val):
-        if val in ("NA", None):
-            return "NA"
-        try:
-            return f"${float(val):.10f}"
-        except (TypeError, ValueError):
-            return "NA"
+def fmt_pct(val):
+    if val in ("NA", None):
+        return "NA"
+    try:
+        return f"{float(val):.2f}%"
+    except (TypeError, ValueError):
+        return "NA"
 
-    def fmt_money(val):
-        if val in ("NA", None):
-            return "NA"
-        try:
-            num = float(val)
-            if num >= 1_000_000_000:
-                return f"${num/1_000_000_000:.2f}B"
-            if num >= 1_000_000:
-                return f"${num/1_000_000:.2f}M"
-            if num >= 1_000:
-                return f"${num/1_000:.2f}K"
-            return f"${num:.2f}"
-        except (TypeError, ValueError):
-            return "NA"
-
-    def fmt_number(val):
-        if val in ("NA", None):
-            return "NA"
-        try:
-            num = float(val)
-            if num >= 1_000_000_000:
-                return f"{num/1_000_000_000:.2f}B"
-            if num >= 1_000_000:
-                return f"{num/1_000_000:.2f}M"
-            return f"{num:,.0f}"
-        except (TypeError, ValueError):
-            return "NA"
-
-    def fmt_date(val):
-        if val in ("NA", None):
-            return "NA"
-        try:
-            return datetime.fromisoformat(val.replace("Z", "+00:00")).strftime("%Y-%m-%d")
-        except Exception:
-            return "NA"
-
-    market_data = _safe_get(data, {}, "market_data")
-
-    return {
-        "name": _safe_get(data, "NA", "name"),
-        "symbol": (_safe_get(data, "NA", "symbol") or "").upper(),
-        "price_usd": fmt_price(_safe_get(market_data, "NA", "current_price", "usd")),
-        "market_cap": fmt_money(_safe_get(market_data, "NA", "market_cap", "usd")),
-        "market_cap_rank": _safe_get(data, "NA", "market_cap_rank"),
-        "fdv": fmt_money(_safe_get(market_data, "NA", "fully_diluted_valuation", "usd")),
-        "total_volume": fmt_money(_safe_get(market_data, "NA", "total_volume", "usd")),
-        "high_24h": fmt_price(_safe_get(market_data, "NA", "high_24h", "usd")),
-        "low_24h": fmt_price(_safe_get(market_data, "NA", "low_24h", "usd")),
-        "price_change_pct_24h": fmt_pct(_safe_get(market_data, "NA", "price_change_percentage_24h")),
-        "mc_change_24h": fmt_money(_safe_get(market_data, "NA", "market_cap_change_24h")),
-        "mc_change_pct_24h": fmt_pct(_safe_get(market_data, "NA", "market_cap_change_percentage_24h")),
-        "circulating_supply": fmt_number(_safe_get(market_data, "NA", "circulating_supply")),
-        "total_supply": fmt_number(_safe_get(market_data, "NA", "total_supply")),
-        "max_supply": fmt_number(_safe_get(market_data, "NA", "max_supply")),
-        "ath": fmt_price(_safe_get(market_data, "NA", "ath", "usd")),
-        "ath_change_pct": fmt_pct(_safe_get(market_data, "NA", "ath_change_percentage", "usd")),
-        "ath_date": fmt_date(_safe_get(market_data, "NA", "ath_date", "usd")),
-        "atl": fmt_price(_safe_get(market_data, "NA", "atl", "usd")),
-        "atl_change_pct": fmt_pct(_safe_get(market_data, "NA", "atl_change_percentage", "usd")),
-        "atl_date": fmt_date(_safe_get(market_data, "NA", "atl_date", "usd")),
-        "homepage": (
-            _safe_get(data, [], "links", "homepage")[0]
-            if isinstance(_safe_get(data, [], "links", "homepage"), list)
-            and _safe_get(data, [], "links", "homepage")
-            else "NA"
-        ),
-    }
-
-
-def ensure_dataset(contract_address: str) -> str:
+
+def fmt_price(val):
+    if val in ("NA", None):
+        return "NA"
+    try:
+        return f"${float(val):.10f}"
+    except (TypeError, ValueError):
+        return "NA"
+
+
+def fmt_money(val):
+    if val in ("NA", None):
+        return "NA"
+    try:
+        num = float(val)
+    except (TypeError, ValueError):
+        return "NA"
+    divisor, template = _MONEY_FORMATS[bisect_right(_MONEY_BOUNDS, num)]
+    return template.format(num / divisor)
+
+
+def fmt_number(val):
+    if val in ("NA", None):
+        return "NA"
+    try:
+        num = float(val)
+    except (TypeError, ValueError):
+        return "NA"
+    divisor, template = _NUMBER_FORMATS[bisect_right(_NUMBER_BOUNDS, num)]
+    return template.format(num / divisor)
+
+
+@lru_cache(maxsize=1024)
+def _iso_to_date(val: str) -> str:
+    return datetime.fromisoformat(val.replace("Z", "+00:00")).strftime("%Y-%m-%d")
+
+
+def fmt_date(val):
+    if val in ("NA", None):
+        return "NA"
+    try:
+        return _iso_to_date(val)
+    except Exception:
+        return "NA"
+
+
+def extract_coingecko_fields(data: Optional[Dict]) -> CgRow:
+    if not data:
+        return _NA_CG_ROW
+
+    md = data.get("market_data") or {}
+    links = data.get("links") or {}
+    hp_list = links.get("homepage") or []
+    homepage = hp_list[0] if isinstance(hp_list, list) and hp_list else "NA"
+    rank = data.get("market_cap_rank")
+
+    return CgRow(
+        name=data.get("name") or "NA",
+        symbol=(data.get("symbol") or "NA").upper(),
+        price_usd=fmt_price((md.get("current_price") or {}).get("usd")),
+        market_cap=fmt_money((md.get("market_cap") or {}).get("usd")),
+        market_cap_rank="NA" if rank is None else rank,
+        fdv=fmt_money((md.get("fully_diluted_valuation") or {}).get("usd")),
+        total_volume=fmt_money((md.get("total_volume") or {}).get("usd")),
+        high_24h=fmt_price((md.get("high_24h") or {}).get("usd")),
+        low_24h=fmt_price((md.get("low_24h") or {}).get("usd")),
+        price_change_pct_24h=fmt_pct(md.get("price_change_percentage_24h")),
+        mc_change_24h=fmt_money(md.get("market_cap_change_24h")),
+        mc_change_pct_24h=fmt_pct(md.get("market_cap_change_percentage_24h")),
+        circulating_supply=fmt_number(md.get("circulating_supply")),
+        total_supply=fmt_number(md.get("total_supply")),
+        max_supply=fmt_number(md.get("max_supply")),
+        ath=fmt_price((md.get("ath") or {}).get("usd")),
+        ath_change_pct=fmt_pct((md.get("ath_change_percentage") or {}).get("usd")),
+        ath_date=fmt_date((md.get("ath_date") or {}).get("usd")),
+        atl=fmt_price((md.get("atl") or {}).get("usd")),
+        atl_change_pct=fmt_pct((md.get("atl_change_percentage") or {}).get("usd")),
+        atl_date=fmt_date((md.get("atl_date") or {}).get("usd")),
+        homepage=homepage,
+    )
+
+
+def extract_market_fields(entry: Dict, homepage: str) -> CgRow:
+    """Build a CgRow from a /coins/markets entry, which is flat and carries no links."""
+    rank = entry.get("market_cap_rank")
+    return CgRow(
+        name=entry.get("name") or "NA",
+        symbol=(entry.get("symbol") or "NA").upper(),
+        price_usd=fmt_price(entry.get("current_price")),
+        market_cap=fmt_money(entry.get("market_cap")),
+        market_cap_rank="NA" if rank is None else rank,
+        fdv=fmt_money(entry.get("fully_diluted_valuation")),
+        total_volume=fmt_money(entry.get("total_volume")),
+        high_24h=fmt_price(entry.get("high_24h")),
+        low_24h=fmt_price(entry.get("low_24h")),
+        price_change_pct_24h=fmt_pct(entry.get("price_change_percentage_24h")),
+        mc_change_24h=fmt_money(entry.get("market_cap_change_24h")),
+        mc_change_pct_24h=fmt_pct(entry.get("market_cap_change_percentage_24h")),
+        circulating_supply=fmt_number(entry.get("circulating_supply")),
+        total_supply=fmt_number(entry.get("total_supply")),
+        max_supply=fmt_number(entry.get("max_supply")),
+        ath=fmt_price(entry.get("ath")),
+        ath_change_pct=fmt_pct(entry.get("ath_change_percentage")),
+        ath_date=fmt_date(entry.get("ath_date")),
+        atl=fmt_price(entry.get("atl")),
+        atl_change_pct=fmt_pct(entry.get("atl_change_percentage")),
+        atl_date=fmt_date(entry.get("atl_date")),
+        homepage=homepage,
+    )
+
+
+_CSV_SPECIAL = re.compile(r'[,"\r\n]')
+
+
+def encode_csv_row(values: Iterable) -> bytes:
+    """Encode one CSV line byte-for-byte like csv.writer, only invoking it when a field needs quoting."""
+    fields = [str(value) for value in values]
+    if any(_CSV_SPECIAL.search(field) for field in fields):
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(fields)
+        return buffer.getvalue().encode("utf-8")
+    return (",".join(fields) + "\r\n").encode("utf-8")
+
+
+def ensure_dataset(contract_address: str) -> BinaryIO:
     filename = f"coingecko_{contract_address}.csv"
-    if not os.path.exists(filename):
-        with open(filename, "w", newline="", encoding="utf-8") as handle:
-            writer = csv.writer(handle)
-            writer.writerow(COINGECKO_HEADERS)
+    is_new = not os.path.exists(filename)
+    handle = open(filename, "ab")
+    atexit.register(handle.close)
+    if is_new:
+        handle.write(encode_csv_row(COINGECKO_HEADERS))
+        handle.flush()
         print(f"[init] created {filename}")
-    return filename
-
-
-def append_row(filename: str, contract_address: str, cg_fields: Dict[str, str]) -> None:
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(filename, "a", newline="", encoding="utf-8") as handle:
-        writer = csv.writer(handle)
-        writer.writerow(
-            [
-                timestamp,
-                timestamp,
-                contract_address,
-                cg_fields["name"],
-                cg_fields["symbol"],
-                cg_fields["price_usd"],
-                cg_fields["market_cap"],
-                cg_fields["market_cap_rank"],
-                cg_fields["fdv"],
-                cg_fields["total_volume"],
-                cg_fields["high_24h"],
-                cg_fields["low_24h"],
-                cg_fields["price_change_pct_24h"],
-                cg_fields["mc_change_24h"],
-                cg_fields["mc_change_pct_24h"],
-                cg_fields["circulating_supply"],
-                cg_fields["total_supply"],
-                cg_fields["max_supply"],
-                cg_fields["ath"],
-                cg_fields["ath_change_pct"],
-                cg_fields["ath_date"],
-                cg_fields["atl"],
-                cg_fields["atl_change_pct"],
-                cg_fields["atl_date"],
-                cg_fields["homepage"],
-            ]
-        )
+    return handle
+
+
+_ts_cache = (0, "")
+
+
+def now_str() -> str:
+    """Local "%Y-%m-%d %H:%M:%S" timestamp, formatted at most once per second."""
+    global _ts_cache
+    sec = int(time.time())
+    cached_sec, text = _ts_cache
+    if sec != cached_sec:
+        text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+        _ts_cache = (sec, text)
+    return text
+
+
+def append_row(handle: BinaryIO, contract_address: str, cg_fields: CgRow) -> None:
+    timestamp = now_str()
+    handle.write(encode_csv_row((timestamp, timestamp, contract_address) + cg_fields))
 
 
 def prompt_token_addresses() -> List[str]:
@@ -254,28 +400,89 @@ def prompt_token_addresses() -> List[str]:
     return addresses
 
 
+def poll_token(
+    cg_client: CoinGeckoClient, handle: BinaryIO, addr: str, idx: int, total: int
+) -> Optional[Tuple[str, str]]:
+    """Fetch one contract and return (coin id, homepage) once CoinGecko knows the token."""
+    print(f"[fetch] ({idx}/{total}) {addr} -> coingecko")
+    try:
+        report, fresh = cg_client.fetch(addr)
+        if not report:
+            print(f"[warn] {addr}: no coingecko data")
+            return None
+        cg_fields = extract_coingecko_fields(report)
+        if fresh:
+            append_row(handle, addr, cg_fields)
+            print(f"[saved] {addr}: {cg_fields.price_usd}")
+        else:
+            print(f"[skip] {addr}: coingecko data unchanged")
+        coin_id = report.get("id")
+        return (coin_id, cg_fields.homepage) if coin_id else None
+    except Exception as exc:
+        print(f"[error] {addr}: {exc}")
+    return None
+
+
+def poll_markets(
+    cg_client: CoinGeckoClient,
+    files_map: Dict[str, BinaryIO],
+    coin_ids: Dict[str, Tuple[str, str]],
+    addresses: List[str],
+) -> None:
+    print(f"[fetch] {len(addresses)} tokens -> coingecko markets")
+    markets, fresh = cg_client.fetch_markets([coin_ids[addr][0] for addr in addresses])
+    if markets and not fresh:
+        # Served from cache or revalidated with a 304: the rows would repeat the last ones.
+        print("[skip] coingecko markets unchanged")
+        return
+    for addr in addresses:
+        coin_id, homepage = coin_ids[addr]
+        entry = markets.get(coin_id)
+        if not entry:
+            print(f"[warn] {addr}: no coingecko data")
+            continue
+        try:
+            cg_fields = extract_market_fields(entry, homepage)
+            append_row(files_map[addr], addr, cg_fields)
+            print(f"[saved] {addr}: {cg_fields.price_usd}")
+        except Exception as exc:
+            print(f"[error] {addr}: {exc}")
+
+
 def main() -> None:
     token_addresses = prompt_token_addresses()
-    cg_client = CoinGeckoClient()
-    files_map: Dict[str, str] = {addr: ensure_dataset(addr) for addr in token_addresses}
+    cg_client = CoinGeckoClient(rate_limiter=TokenBucket(rate=0.5, capacity=5))
+    files_map: Dict[str, BinaryIO] = {addr: ensure_dataset(addr) for addr in token_addresses}
+    # Contract address -> (CoinGecko coin id, homepage), learned from the first contract lookup.
+    coin_ids: Dict[str, Tuple[str, str]] = {}
+    total = len(token_addresses)
+    last_flush = time.monotonic()
 
     try:
-        while True:
-            for idx, addr in enumerate(token_addresses, start=1):
-                print(f"[fetch] ({idx}/{len(token_addresses)}) {addr} -> coingecko")
-                try:
-                    report = cg_client.fetch(addr)
-                    if not report:
-                        print(f"[warn] {addr}: no coingecko data")
-                    else:
-                        cg_fields = extract_coingecko_fields(report)
-                        append_row(files_map[addr], addr, cg_fields)
-                        print(f"[saved] {addr}: {cg_fields['price_usd']}")
-                except Exception as exc:
-                    print(f"[error] {addr}: {exc}")
-
-                for _ in range(17):
-                    time.sleep(1)
+        with ThreadPoolExecutor(max_workers=min(10, total)) as executor:
+            while True:
+                cycle_start = time.monotonic()
+                batched = [addr for addr in token_addresses if addr in coin_ids]
+                futures = {
+                    addr: executor.submit(poll_token, cg_client, files_map[addr], addr, idx, total)
+                    for idx, addr in enumerate(token_addresses, start=1)
+                    if addr not in coin_ids
+                }
+                if batched:
+                    poll_markets(cg_client, files_map, coin_ids, batched)
+                for addr, future in futures.items():
+                    resolved = future.result()
+                    if resolved:
+                        coin_ids[addr] = resolved
+
+                if time.monotonic() - last_flush >= FLUSH_SECONDS:
+                    for handle in files_map.values():
+                        handle.flush()
+                    last_flush = time.monotonic()
+
+                remaining = cycle_start + CYCLE_SECONDS - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
     except KeyboardInterrupt:
         print("[info] stopping coingecko scraper")
 
@@ -1,13 +1,31 @@
 import csv
 import os
-import re
+import queue
 import threading
 import time
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Set
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, List, Optional, Set, TextIO, Tuple
 
 import requests
-from bs4 import BeautifulSoup
+
+from scrape_common import (
+    NUM_MULTIPLIERS,
+    NUM_RE,
+    body_digest,
+    build_session,
+    extract_fields,
+    extract_rug_fields,
+    load_json,
+    message_digest,
+    parse_telegram_page,
+    project_rug_report,
+    prompt_token_addresses,
+    tally_sentiment,
+)
 
 
 CSV_HEADERS = [
@@ -84,29 +102,102 @@ TELEGRAM_HEADERS = [
 
 ALL_HEADERS = ALL_HEADERS + COINGECKO_HEADERS + TELEGRAM_HEADERS
 
+# Keys of extract_fields, in CSV_HEADERS order.
+DEX_FIELD_KEYS = (
+    "name",
+    "x_account",
+    "telegram",
+    "total_liquidity",
+    "liquidity_locked",
+    "fdv",
+    "market_cap",
+    "price_usd",
+    "m5_change",
+    "h1_change",
+    "h6_change",
+    "h24_change",
+    "pair_age",
+    "pooled_sol",
+)
+
+# Keys of extract_rug_fields, in RUG_HEADERS order.
+RUG_FIELD_KEYS = (
+    "token_name",
+    "token_symbol",
+    "risk_score",
+    "risk_assessment",
+    "supply",
+    "mint_authority",
+    "freeze_authority",
+    "lp_locked_pct",
+    "top_10_pct",
+)
+
+# Keys of extract_coingecko_fields, in COINGECKO_HEADERS order.
+CG_FIELD_KEYS = (
+    "name",
+    "symbol",
+    "price_usd",
+    "market_cap",
+    "market_cap_rank",
+    "fdv",
+    "total_volume",
+    "high_24h",
+    "low_24h",
+    "price_change_pct_24h",
+    "mc_change_24h",
+    "mc_change_pct_24h",
+    "circulating_supply",
+    "total_supply",
+    "max_supply",
+    "ath",
+    "ath_change_pct",
+    "ath_date",
+    "atl",
+    "atl_change_pct",
+    "atl_date",
+    "homepage",
+)
+
+# Keys of TelegramSentiment.fetch_and_analyze, in TELEGRAM_HEADERS order.
+TG_FIELD_KEYS = (
+    "channel",
+    "channel_title",
+    "subscribers",
+    "messages_analyzed",
+    "positive",
+    "negative",
+    "neutral",
+    "positive_pct",
+    "negative_pct",
+    "neutral_pct",
+    "new_messages",
+)
+
+_DEX_VALUES = itemgetter(*DEX_FIELD_KEYS)
+_RUG_VALUES = itemgetter(*RUG_FIELD_KEYS)
+_CG_VALUES = itemgetter(*CG_FIELD_KEYS)
+_TG_VALUES = itemgetter(*TG_FIELD_KEYS)
+
 
 class DexScreenerClient:
     """Lightweight client around the DexScreener public API."""
 
     BASE_URL = "https://api.dexscreener.com/latest/dex/tokens/{token_address}"
+    # Requests in flight to the host at once, across all token workers.
+    MAX_IN_FLIGHT = 5
 
-    def __init__(self) -> None:
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
-                )
-            }
-        )
+    def __init__(self, session: Optional[requests.Session] = None) -> None:
+        self.session = session or build_session()
+        self._slots = threading.BoundedSemaphore(self.MAX_IN_FLIGHT)
 
     def fetch_pair(self, token_address: str) -> Optional[Dict]:
         url = self.BASE_URL.format(token_address=token_address.strip())
         try:
-            response = self.session.get(url, timeout=10)
+            with self._slots:
+                response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            payload = response.json()
+            payload = load_json(response)
         except requests.RequestException as exc:  # network or HTTP errors
             print(f"[warn] {token_address}: request failed: {exc}")
             return None
@@ -125,179 +216,90 @@ class RugCheckClient:
     """Client for RugCheck token reports."""
 
     BASE_URL = "https://api.rugcheck.xyz/v1/tokens/{token_address}/report"
+    MAX_IN_FLIGHT = 5
+    # Authorities, supply and holder split change slowly; reuse a report for five minutes.
+    CACHE_TTL = 300.0
 
-    def __init__(self) -> None:
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
-                )
-            }
-        )
+    def __init__(self, session: Optional[requests.Session] = None) -> None:
+        self.session = session or build_session()
+        self._slots = threading.BoundedSemaphore(self.MAX_IN_FLIGHT)
+        self._cache: Dict[str, Tuple[float, int, Dict]] = {}
 
     def fetch_report(self, token_address: str) -> Optional[Dict]:
+        cached = self._cache.get(token_address)
+        if cached is not None and time.monotonic() - cached[0] < self.CACHE_TTL:
+            return cached[2]
         url = self.BASE_URL.format(token_address=token_address.strip())
         try:
-            response = self.session.get(url, timeout=10)
+            with self._slots:
+                response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            return response.json()
+            digest = body_digest(response.content)
+            # An unchanged body hands back the previous object, so callers can skip re-extracting it.
+            report = cached[2] if cached is not None and cached[1] == digest else project_rug_report(load_json(response))
         except requests.RequestException as exc:
             print(f"[warn] {token_address}: rugcheck request failed: {exc}")
+            return None
         except ValueError:
             print(f"[warn] {token_address}: rugcheck invalid JSON")
-        return None
+            return None
+        self._cache[token_address] = (time.monotonic(), digest, report)
+        return report
 
 
 class CoinGeckoClient:
     """Client for CoinGecko contract data (Solana network)."""
 
     BASE_URL = "https://api.coingecko.com/api/v3/coins/solana/contract/{contract}"
+    HEADERS = {"Accept": "application/json"}
+    MAX_IN_FLIGHT = 5
+    # CoinGecko refreshes its market data roughly once a minute.
+    CACHE_TTL = 60.0
 
-    def __init__(self) -> None:
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
-                ),
-                "Accept": "application/json",
-            }
-        )
+    def __init__(self, session: Optional[requests.Session] = None) -> None:
+        self.session = session or build_session()
+        self._slots = threading.BoundedSemaphore(self.MAX_IN_FLIGHT)
+        self._cache: Dict[str, Tuple[float, int, Dict]] = {}
 
     def fetch(self, contract_address: str) -> Optional[Dict]:
+        cached = self._cache.get(contract_address)
+        if cached is not None and time.monotonic() - cached[0] < self.CACHE_TTL:
+            return cached[2]
         url = self.BASE_URL.format(contract=contract_address.strip())
         try:
-            response = self.session.get(url, timeout=20)
+            with self._slots:
+                response = self.session.get(url, headers=self.HEADERS, timeout=20)
             response.raise_for_status()
-            return response.json()
+            digest = body_digest(response.content)
+            # An unchanged body hands back the previous object, so callers can skip re-extracting it.
+            data = cached[2] if cached is not None and cached[1] == digest else load_json(response)
         except requests.RequestException as exc:
             print(f"[warn] {contract_address}: coingecko request failed: {exc}")
+            return None
         except ValueError:
             print(f"[warn] {contract_address}: coingecko invalid JSON")
-        return None
-
-
-# Sentiment keyword lists (simple substring matching)
-POSITIVE_WORDS = [
-    "bullish",
-    "moon",
-    "pump",
-    "buy",
-    "buying",
-    "hold",
-    "hodl",
-    "long",
-    "gem",
-    "rocket",
-    "🚀",
-    "🌙",
-    "💎",
-    "🔥",
-    "lambo",
-    "profit",
-    "gains",
-    "up",
-    "green",
-    "win",
-    "winner",
-    "strong",
-    "support",
-    "love",
-    "great",
-    "amazing",
-    "best",
-    "good",
-    "nice",
-    "awesome",
-    "excellent",
-    "perfect",
-    "bull",
-    "breakout",
-    "mooning",
-    "pumping",
-    "bullrun",
-    "ath",
-    "undervalued",
-    "potential",
-    "accumulate",
-    "bullmarket",
-    "to the moon",
-    "lets go",
-    "lfg",
-    "based",
-]
-
-
-NEGATIVE_WORDS = [
-    "bearish",
-    "dump",
-    "sell",
-    "selling",
-    "short",
-    "crash",
-    "scam",
-    "rug",
-    "rugpull",
-    "down",
-    "red",
-    "loss",
-    "lose",
-    "losing",
-    "bear",
-    "dead",
-    "shit",
-    "trash",
-    "bad",
-    "worst",
-    "terrible",
-    "avoid",
-    "warning",
-    "danger",
-    "overvalued",
-    "bubble",
-    "ponzi",
-    "fake",
-    "exit",
-    "rekt",
-    "bearmarket",
-    "falling",
-    "collapse",
-    "scam",
-]
+            return None
+        self._cache[contract_address] = (time.monotonic(), digest, data)
+        return data
 
 
 class TelegramSentiment:
     """Scrapes public Telegram channel preview pages and infers simple sentiment."""
 
-    def __init__(self) -> None:
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
-                )
-            }
-        )
-        self.seen_messages: Set[str] = set()
+    def __init__(self, session: Optional[requests.Session] = None) -> None:
+        self.session = session or build_session()
+        self.seen_messages: Set[int] = set()
         self.first_run = True
 
     def _parse_number(self, text: str) -> int:
         if not text:
             return 0
-        text = text.strip().upper().replace(",", "")
-        match = re.search(r"([\d.]+)\s*([KMB])?", text)
+        match = NUM_RE.search(text.strip().upper().replace(",", ""))
         if not match:
             return 0
         try:
-            number = float(match.group(1))
-            suffix = match.group(2) or ""
-            multipliers = {"K": 1_000, "M": 1_000_000, "B": 1_000_000_000}
-            return int(number * multipliers.get(suffix, 1))
-        except Exception:
+            return int(float(match.group(1)) * NUM_MULTIPLIERS[match.group(2) or ""])
+        except ValueError:
             return 0
 
     def _normalize_username(self, telegram_field: str) -> Optional[str]:
@@ -313,6 +315,11 @@ class TelegramSentiment:
         username = username.strip()
         return username or None
 
+    def _get_page(self, url: str, delay: float) -> requests.Response:
+        if delay:
+            time.sleep(delay)
+        return self.session.get(url, timeout=13)
+
     def _scrape_channel(self, username: str, fetch_more: bool) -> Optional[Dict]:
         base_url = f"https://t.me/s/{username}"
         pages = 5 if fetch_more else 1
@@ -320,44 +327,46 @@ class TelegramSentiment:
         subscribers = 0
         messages: List[str] = []
 
-        for page in range(pages):
-            url = base_url if page == 0 else f"{base_url}?before={page * 20}"
+        def fetch(page: int, url: str):
             try:
-                resp = self.session.get(url, timeout=13)
+                return self._get_page(url, page * 0.2), None
             except requests.RequestException as exc:
-                print(f"[warn] telegram request failed: {exc}")
+                return None, exc
+
+        urls = [base_url] + [f"{base_url}?before={page * 20}" for page in range(1, pages)]
+        if pages == 1:
+            results = [fetch(0, base_url)]
+        else:
+            # Pages are independent, so fetch them together with a short stagger.
+            with ThreadPoolExecutor(max_workers=pages) as pool:
+                results = list(pool.map(fetch, range(pages), urls))
+
+        for page, (resp, error) in enumerate(results):
+            if error is not None:
+                print(f"[warn] telegram request failed: {error}")
                 break
 
             if resp.status_code != 200:
                 print(f"[warn] telegram HTTP {resp.status_code} for {username}")
                 break
 
-            soup = BeautifulSoup(resp.content, "html.parser")
+            title, counter, texts = parse_telegram_page(resp.content, header=page == 0)
 
             if page == 0:
-                title_elem = soup.find("div", class_="tgme_channel_info_header_title")
-                if title_elem:
-                    channel_title = title_elem.get_text(strip=True)
+                if title:
+                    channel_title = title
+                if counter:
+                    subscribers = self._parse_number(counter)
 
-                counter_elem = soup.find("div", class_="tgme_channel_info_counter")
-                if counter_elem:
-                    subscribers = self._parse_number(counter_elem.get_text(strip=True))
-
-            for msg_div in soup.find_all("div", class_="tgme_widget_message_text"):
-                message_text = msg_div.get_text(strip=True)
+            for message_text in texts:
                 if not message_text:
                     continue
-                msg_id = message_text[:120]
+                msg_id = message_digest(message_text)
                 if msg_id in self.seen_messages:
                     continue
                 self.seen_messages.add(msg_id)
                 messages.append(message_text)
 
-            if not fetch_more:
-                break
-            if page < pages - 1:
-                time.sleep(1)
-
         return {
             "username": username,
             "channel_title": channel_title,
@@ -378,22 +387,8 @@ class TelegramSentiment:
                 "new_messages": 0,
             }
 
-        sentiments = []
-        for msg in messages:
-            msg_lower = msg.lower()
-            pos_count = sum(1 for w in POSITIVE_WORDS if w in msg_lower)
-            neg_count = sum(1 for w in NEGATIVE_WORDS if w in msg_lower)
-            if pos_count > neg_count:
-                sentiments.append("positive")
-            elif neg_count > pos_count:
-                sentiments.append("negative")
-            else:
-                sentiments.append("neutral")
-
-        total = len(sentiments)
-        positive = sentiments.count("positive")
-        negative = sentiments.count("negative")
-        neutral = sentiments.count("neutral")
+        positive, negative, neutral = tally_sentiment(messages)
+        total = len(messages)
 
         def pct(part: int) -> str:
             return f"{(part / total * 100):.1f}%" if total else "0%"
@@ -469,331 +464,108 @@ class RedditSentiment:
         }
 
 
-def _safe_get(data: Dict, default="NA", *keys):
-    current = data
-    for key in keys:
-        if not isinstance(current, dict):
-            return default
-        current = current.get(key, default)
-    return default if current is None else current
+# Value buckets split at these thresholds, each with its (divisor, template).
+_MONEY_BOUNDS = (1_000, 1_000_000, 1_000_000_000)
+_MONEY_FORMATS = ((1, "${:.2f}"), (1_000, "${:.2f}K"), (1_000_000, "${:.2f}M"), (1_000_000_000, "${:.2f}B"))
+_NUMBER_BOUNDS = (1_000_000, 1_000_000_000)
+_NUMBER_FORMATS = ((1, "{:,.0f}"), (1_000_000, "{:.2f}M"), (1_000_000_000, "{:.2f}B"))
 
 
-def format_money(value: Optional[float]) -> str:
-    if value is None or value == 0:
+def fmt_pct(val):
+    if val in ("NA", None):
         return "NA"
     try:
-        return f"${float(value):,.2f}"
+        return f"{float(val):.2f}%"
     except (TypeError, ValueError):
         return "NA"
 
 
-def format_change(value: Optional[float]) -> str:
-    if value is None:
+def fmt_price(val):
+    if val in ("NA", None):
         return "NA"
     try:
-        return f"{float(value):.2f}%"
+        return f"${float(val):.10f}"
     except (TypeError, ValueError):
         return "NA"
 
 
-def extract_fields(pair_data: Dict) -> Optional[Dict[str, str]]:
-    if not pair_data:
-        return None
-
-    socials = _safe_get(pair_data, [], "info", "socials")
-    x_account = "NA"
-    telegram = "NA"
-    if isinstance(socials, list):
-        for social in socials:
-            if not isinstance(social, dict):
-                continue
-            social_type = (social.get("type") or "").lower()
-            url = social.get("url") or ""
-            if social_type == "twitter":
-                if "twitter.com/" in url:
-                    x_account = "@" + url.rsplit("/", 1)[-1]
-                elif "x.com/" in url:
-                    x_account = "@" + url.rsplit("/", 1)[-1]
-            elif social_type == "telegram":
-                if "t.me/" in url:
-                    telegram = "@" + url.rsplit("/", 1)[-1]
-                else:
-                    telegram = url
-
-    liquidity_usd = _safe_get(pair_data, 0, "liquidity", "usd")
-    liquidity_locked = "NA"
-    boosts = pair_data.get("boosts") or {}
-    if isinstance(boosts, dict) and boosts.get("active", 0) > 0:
-        liquidity_locked = "Yes"
-
-    fdv = _safe_get(pair_data, 0, "fdv")
-    market_cap = _safe_get(pair_data, 0, "marketCap")
-
-    price_usd = _safe_get(pair_data, "NA", "priceUsd")
+def fmt_money(val):
+    if val in ("NA", None):
+        return "NA"
     try:
-        price_usd = f"${float(price_usd):.10f}" if price_usd != "NA" else "NA"
+        num = float(val)
     except (TypeError, ValueError):
-        price_usd = "NA"
-
-    price_change = _safe_get(pair_data, {}, "priceChange")
-    pair_created_at = _safe_get(pair_data, 0, "pairCreatedAt")
-    pair_age_hours = "NA"
-    if pair_created_at:
-        try:
-            created_dt = datetime.fromtimestamp(pair_created_at / 1000)
-            pair_age_hours = f"{(datetime.now() - created_dt).total_seconds() / 3600:.1f}"
-        except (TypeError, ValueError):
-            pair_age_hours = "NA"
-
-    pooled_sol = "NA"
-    quote_symbol = _safe_get(pair_data, "", "quoteToken", "symbol")
-    if quote_symbol == "SOL":
-        quote_liquidity = _safe_get(pair_data, 0, "liquidity", "quote")
-        try:
-            pooled_sol = f"{float(quote_liquidity):.2f} SOL" if quote_liquidity else "NA"
-        except (TypeError, ValueError):
-            pooled_sol = "NA"
-
-    return {
-        "name": _safe_get(pair_data, "Unknown", "baseToken", "name"),
-        "x_account": x_account,
-        "telegram": telegram,
-        "total_liquidity": format_money(liquidity_usd),
-        "liquidity_locked": liquidity_locked,
-        "fdv": format_money(fdv),
-        "market_cap": format_money(market_cap),
-        "price_usd": price_usd,
-        "m5_change": format_change(_safe_get(price_change, None, "m5")),
-        "h1_change": format_change(_safe_get(price_change, None, "h1")),
-        "h6_change": format_change(_safe_get(price_change, None, "h6")),
-        "h24_change": format_change(_safe_get(price_change, None, "h24")),
-        "pair_age": pair_age_hours,
-        "pooled_sol": pooled_sol,
-    }
-
+        return "NA"
+    divisor, template = _MONEY_FORMATS[bisect_right(_MONEY_BOUNDS, num)]
+    return template.format(num / divisor)
 
-def extract_rug_fields(report: Optional[Dict]) -> Dict[str, str]:
-    if not report:
-        return {
-            "token_name": "NA",
-            "token_symbol": "NA",
-            "risk_score": "NA",
-            "risk_assessment": "NA",
-            "supply": "NA",
-            "mint_authority": "NA",
-            "freeze_authority": "NA",
-            "lp_locked_pct": "NA",
-            "top_10_pct": "NA",
-        }
 
-    def safe_get(obj: Dict, default="NA", *keys):
-        cur = obj
-        for key in keys:
-            if not isinstance(cur, dict):
-                return default
-            cur = cur.get(key, default)
-        return default if cur is None else cur
-
-    token_name = safe_get(report, "Unknown", "tokenMeta", "name")
-    token_symbol = safe_get(report, "Unknown", "tokenMeta", "symbol")
-
-    raw_scores = [
-        safe_get(report, 0, "score"),
-        safe_get(report, 0, "aggregate", "score"),
-        safe_get(report, 0, "fileMeta", "score"),
-    ]
-    numeric_scores = [s for s in raw_scores if isinstance(s, (int, float))]
-    risk_score = min(numeric_scores) if numeric_scores else 0
-    if risk_score > 100:
-        risk_score = min(int(risk_score / 50), 100)
-
-    if risk_score <= 20:
-        risk_assessment = "Good"
-    elif risk_score <= 50:
-        risk_assessment = "Neutral"
-    elif risk_score <= 80:
-        risk_assessment = "Warning"
-    else:
-        risk_assessment = "Bad"
-
-    supply_raw = safe_get(report, 0, "token", "supply")
-    decimals = safe_get(report, 9, "token", "decimals")
-    supply = "NA"
+def fmt_number(val):
+    if val in ("NA", None):
+        return "NA"
     try:
-        adjusted = float(supply_raw) / (10 ** int(decimals)) if supply_raw else 0
-        if adjusted >= 1_000_000_000:
-            supply = f"{adjusted/1_000_000_000:.1f}B"
-        elif adjusted >= 1_000_000:
-            supply = f"{adjusted/1_000_000:.1f}M"
-        elif adjusted > 0:
-            supply = f"{adjusted:,.0f}"
+        num = float(val)
     except (TypeError, ValueError):
-        supply = "NA"
-
-    mint_authority = safe_get(report, None, "token", "mintAuthority")
-    mint_authority = "Revoked" if not mint_authority or mint_authority == "null" else "Active"
+        return "NA"
+    divisor, template = _NUMBER_FORMATS[bisect_right(_NUMBER_BOUNDS, num)]
+    return template.format(num / divisor)
 
-    freeze_authority = safe_get(report, None, "token", "freezeAuthority")
-    freeze_authority = "Revoked" if not freeze_authority or freeze_authority == "null" else "Active"
 
-    markets = safe_get(report, [], "markets")
-    total_lp_locked = 0.0
-    lp_count = 0
-    if isinstance(markets, list):
-        for market in markets:
-            pct = safe_get(market, 0, "lp", "lpLockedPct")
-            try:
-                pct_val = float(pct)
-                total_lp_locked += pct_val
-                lp_count += 1
-            except (TypeError, ValueError):
-                continue
-    lp_locked_pct = f"{total_lp_locked / lp_count:.2f}%" if lp_count else "0%"
+@lru_cache(maxsize=1024)
+def _iso_to_date(val: str) -> str:
+    return datetime.fromisoformat(val.replace("Z", "+00:00")).strftime("%Y-%m-%d")
 
-    top_holders = safe_get(report, [], "topHolders")
-    top_10_pct_val = 0.0
-    if isinstance(top_holders, list):
-        for holder in top_holders[:10]:
-            pct = safe_get(holder, 0, "pct")
-            try:
-                top_10_pct_val += float(pct)
-            except (TypeError, ValueError):
-                continue
-    top_10_pct = f"{top_10_pct_val:.2f}%" if top_10_pct_val else "NA"
 
-    return {
-        "token_name": token_name,
-        "token_symbol": token_symbol,
-        "risk_score": str(risk_score) if risk_score != "NA" else "NA",
-        "risk_assessment": risk_assessment,
-        "supply": supply,
-        "mint_authority": mint_authority,
-        "freeze_authority": freeze_authority,
-        "lp_locked_pct": lp_locked_pct,
-        "top_10_pct": top_10_pct,
-    }
+def fmt_date(val):
+    if val in ("NA", None):
+        return "NA"
+    try:
+        return _iso_to_date(val)
+    except Exception:
+        return "NA"
 
 
 def extract_coingecko_fields(data: Optional[Dict]) -> Dict[str, str]:
     if not data:
-        return {
-            "name": "NA",
-            "symbol": "NA",
-            "price_usd": "NA",
-            "market_cap": "NA",
-            "market_cap_rank": "NA",
-            "fdv": "NA",
-            "total_volume": "NA",
-            "high_24h": "NA",
-            "low_24h": "NA",
-            "price_change_pct_24h": "NA",
-            "mc_change_24h": "NA",
-            "mc_change_pct_24h": "NA",
-            "circulating_supply": "NA",
-            "total_supply": "NA",
-            "max_supply": "NA",
-            "ath": "NA",
-            "ath_change_pct": "NA",
-            "ath_date": "NA",
-            "atl": "NA",
-            "atl_change_pct": "NA",
-            "atl_date": "NA",
-            "homepage": "NA",
-        }
+        return dict.fromkeys(CG_FIELD_KEYS, "NA")
 
-    def safe_get(obj, default="NA", *keys):
-        cur = obj
-        for key in keys:
-            if not isinstance(cur, dict):
-                return default
-            cur = cur.get(key, default)
-        return default if cur is None else cur
-
-    def fmt_pct(val):
-        if val in ("NA", None):
-            return "NA"
-        try:
-            return f"{float(val):.2f}%"
-        except (TypeError, ValueError):
-            return "NA"
-
-    def fmt_price(val):
-        if val in ("NA", None):
-            return "NA"
-        try:
-            return f"${float(val):.10f}"
-        except (TypeError, ValueError):
-            return "NA"
-
-    def fmt_money(val):
-        if val in ("NA", None):
-            return "NA"
-        try:
-            num = float(val)
-            if num >= 1_000_000_000:
-                return f"${num/1_000_000_000:.2f}B"
-            if num >= 1_000_000:
-                return f"${num/1_000_000:.2f}M"
-            if num >= 1_000:
-                return f"${num/1_000:.2f}K"
-            return f"${num:.2f}"
-        except (TypeError, ValueError):
-            return "NA"
-
-    def fmt_number(val):
-        if val in ("NA", None):
-            return "NA"
-        try:
-            num = float(val)
-            if num >= 1_000_000_000:
-                return f"{num/1_000_000_000:.2f}B"
-            if num >= 1_000_000:
-                return f"{num/1_000_000:.2f}M"
-            return f"{num:,.0f}"
-        except (TypeError, ValueError):
-            return "NA"
-
-    def fmt_date(val):
-        if val in ("NA", None):
-            return "NA"
-        try:
-            return datetime.fromisoformat(val.replace("Z", "+00:00")).strftime("%Y-%m-%d")
-        except Exception:
-            return "NA"
-
-    market_data = safe_get(data, {}, "market_data")
+    md = data.get("market_data") or {}
+    links = data.get("links") or {}
+    hp_list = links.get("homepage") or []
+    homepage = hp_list[0] if isinstance(hp_list, list) and hp_list else "NA"
+    rank = data.get("market_cap_rank")
 
     return {
-        "name": safe_get(data, "NA", "name"),
-        "symbol": (safe_get(data, "NA", "symbol") or "").upper(),
-        "price_usd": fmt_price(safe_get(market_data, "NA", "current_price", "usd")),
-        "market_cap": fmt_money(safe_get(market_data, "NA", "market_cap", "usd")),
-        "market_cap_rank": safe_get(data, "NA", "market_cap_rank"),
-        "fdv": fmt_money(safe_get(market_data, "NA", "fully_diluted_valuation", "usd")),
-        "total_volume": fmt_money(safe_get(market_data, "NA", "total_volume", "usd")),
-        "high_24h": fmt_price(safe_get(market_data, "NA", "high_24h", "usd")),
-        "low_24h": fmt_price(safe_get(market_data, "NA", "low_24h", "usd")),
-        "price_change_pct_24h": fmt_pct(safe_get(market_data, "NA", "price_change_percentage_24h")),
-        "mc_change_24h": fmt_money(safe_get(market_data, "NA", "market_cap_change_24h")),
-        "mc_change_pct_24h": fmt_pct(safe_get(market_data, "NA", "market_cap_change_percentage_24h")),
-        "circulating_supply": fmt_number(safe_get(market_data, "NA", "circulating_supply")),
-        "total_supply": fmt_number(safe_get(market_data, "NA", "total_supply")),
-        "max_supply": fmt_number(safe_get(market_data, "NA", "max_supply")),
-        "ath": fmt_price(safe_get(market_data, "NA", "ath", "usd")),
-        "ath_change_pct": fmt_pct(safe_get(market_data, "NA", "ath_change_percentage", "usd")),
-        "ath_date": fmt_date(safe_get(market_data, "NA", "ath_date", "usd")),
-        "atl": fmt_price(safe_get(market_data, "NA", "atl", "usd")),
-        "atl_change_pct": fmt_pct(safe_get(market_data, "NA", "atl_change_percentage", "usd")),
-        "atl_date": fmt_date(safe_get(market_data, "NA", "atl_date", "usd")),
-        "homepage": (
-            safe_get(data, [], "links", "homepage")[0]
-            if isinstance(safe_get(data, [], "links", "homepage"), list)
-            and safe_get(data, [], "links", "homepage")
-            else "NA"
-        ),
+        "name": data.get("name") or "NA",
+        "symbol": (data.get("symbol") or "NA").upper(),
+        "price_usd": fmt_price((md.get("current_price") or {}).get("usd")),
+        "market_cap": fmt_money((md.get("market_cap") or {}).get("usd")),
+        "market_cap_rank": "NA" if rank is None else rank,
+        "fdv": fmt_money((md.get("fully_diluted_valuation") or {}).get("usd")),
+        "total_volume": fmt_money((md.get("total_volume") or {}).get("usd")),
+        "high_24h": fmt_price((md.get("high_24h") or {}).get("usd")),
+        "low_24h": fmt_price((md.get("low_24h") or {}).get("usd")),
+        "price_change_pct_24h": fmt_pct(md.get("price_change_percentage_24h")),
+        "mc_change_24h": fmt_money(md.get("market_cap_change_24h")),
+        "mc_change_pct_24h": fmt_pct(md.get("market_cap_change_percentage_24h")),
+        "circulating_supply": fmt_number(md.get("circulating_supply")),
+        "total_supply": fmt_number(md.get("total_supply")),
+        "max_supply": fmt_number(md.get("max_supply")),
+        "ath": fmt_price((md.get("ath") or {}).get("usd")),
+        "ath_change_pct": fmt_pct((md.get("ath_change_percentage") or {}).get("usd")),
+        "ath_date": fmt_date((md.get("ath_date") or {}).get("usd")),
+        "atl": fmt_price((md.get("atl") or {}).get("usd")),
+        "atl_change_pct": fmt_pct((md.get("atl_change_percentage") or {}).get("usd")),
+        "atl_date": fmt_date((md.get("atl_date") or {}).get("usd")),
+        "homepage": homepage,
     }
 
 
+# RowWriter flushes once this many rows accumulate, or after FLUSH_SECONDS.
+FLUSH_ROWS = 10
+FLUSH_SECONDS = 60
+
+
 def ensure_csv(token_address: str) -> str:
     filename = f"{token_address}.csv"
     if not os.path.exists(filename):
@@ -804,78 +576,105 @@ def ensure_csv(token_address: str) -> str:
     return filename
 
 
-def append_row(
-    filename: str,
+def build_row(
     token_address: str,
     dex_fields: Dict[str, str],
     rug_fields: Dict[str, str],
     cg_fields: Dict[str, str],
     tg_fields: Dict[str, str],
-) -> None:
-    with open(filename, "a", newline="", encoding="utf-8") as handle:
-        writer = csv.writer(handle)
-        writer.writerow(
-            [
-                datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                token_address,
-                dex_fields["name"],
-                dex_fields["x_account"],
-                dex_fields["telegram"],
-                dex_fields["total_liquidity"],
-                dex_fields["liquidity_locked"],
-                dex_fields["fdv"],
-                dex_fields["market_cap"],
-                dex_fields["price_usd"],
-                dex_fields["m5_change"],
-                dex_fields["h1_change"],
-                dex_fields["h6_change"],
-                dex_fields["h24_change"],
-                dex_fields["pair_age"],
-                dex_fields["pooled_sol"],
-                rug_fields["token_name"],
-                rug_fields["token_symbol"],
-                rug_fields["risk_score"],
-                rug_fields["risk_assessment"],
-                rug_fields["supply"],
-                rug_fields["mint_authority"],
-                rug_fields["freeze_authority"],
-                rug_fields["lp_locked_pct"],
-                rug_fields["top_10_pct"],
-                cg_fields["name"],
-                cg_fields["symbol"],
-                cg_fields["price_usd"],
-                cg_fields["market_cap"],
-                cg_fields["market_cap_rank"],
-                cg_fields["fdv"],
-                cg_fields["total_volume"],
-                cg_fields["high_24h"],
-                cg_fields["low_24h"],
-                cg_fields["price_change_pct_24h"],
-                cg_fields["mc_change_24h"],
-                cg_fields["mc_change_pct_24h"],
-                cg_fields["circulating_supply"],
-                cg_fields["total_supply"],
-                cg_fields["max_supply"],
-                cg_fields["ath"],
-                cg_fields["ath_change_pct"],
-                cg_fields["ath_date"],
-                cg_fields["atl"],
-                cg_fields["atl_change_pct"],
-                cg_fields["atl_date"],
-                cg_fields["homepage"],
-                tg_fields["channel"],
-                tg_fields["channel_title"],
-                tg_fields["subscribers"],
-                tg_fields["messages_analyzed"],
-                tg_fields["positive"],
-                tg_fields["negative"],
-                tg_fields["neutral"],
-                tg_fields["positive_pct"],
-                tg_fields["negative_pct"],
-                tg_fields["neutral_pct"],
-                tg_fields["new_messages"],
-            ]
-        )
+) -> Tuple[str, ...]:
+    return (
+        (time.strftime("%Y-%m-%d %H:%M:%S"), token_address)
+        + _DEX_VALUES(dex_fields)
+        + _RUG_VALUES(rug_fields)
+        + _CG_VALUES(cg_fields)
+        + _TG_VALUES(tg_fields)
+    )
+
+
+class RowWriter(threading.Thread):
+    """Owns every token CSV; workers hand rows over through a queue and go back to polling."""
+
+    def __init__(self) -> None:
+        super().__init__(daemon=True)
+        self.rows: "queue.Queue[Optional[Tuple[str, Tuple[str, ...]]]]" = queue.Queue(maxsize=1024)
+        self._handles: Dict[str, TextIO] = {}
+        self._writers = {}
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+
+    def submit(self, filename: str, row: Tuple[str, ...]) -> None:
+        # A writer thread that has died would never drain the queue, so drop the row instead of blocking.
+        if not self.is_alive():
+            print(f"[warn] row writer stopped; dropping row for {filename}")
+            return
+        try:
+            self.rows.put((filename, row), timeout=FLUSH_SECONDS)
+        except queue.Full:
+            print(f"[warn] row writer backed up; dropping row for {filename}")
+
+    def close(self) -> None:
+        """Write everything still queued, then close the files."""
+        if not self.is_alive():
+            return
+        try:
+            self.rows.put(None, timeout=FLUSH_SECONDS)
+        except queue.Full:
+            print("[warn] row writer backed up; not waiting for queued rows")
+            return
+        self.join(timeout=FLUSH_SECONDS)
+
+    def _writer_for(self, filename: str):
+        writer = self._writers.get(filename)
+        if writer is None:
+            handle = open(filename, "a", newline="", encoding="utf-8")
+            self._handles[filename] = handle
+            writer = self._writers[filename] = csv.writer(handle)
+        return writer
+
+    def _discard(self, filename: str) -> None:
+        """Forget a file after a write error, so its next row reopens it."""
+        self._writers.pop(filename, None)
+        handle = self._handles.pop(filename, None)
+        if handle is not None:
+            try:
+                handle.close()
+            except OSError:
+                pass
+
+    def _flush(self) -> None:
+        for filename, handle in list(self._handles.items()):
+            try:
+                handle.flush()
+            except OSError as exc:
+                print(f"[warn] {filename}: flush failed: {exc}")
+                self._discard(filename)
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+
+    def run(self) -> None:
+        while True:
+            try:
+                item = self.rows.get(timeout=FLUSH_SECONDS)
+            except queue.Empty:
+                if self._unflushed:
+                    self._flush()
+                continue
+            if item is None:
+                break
+            filename, row = item
+            # A locked file or a full disk costs that row, not the thread every worker depends on.
+            try:
+                self._writer_for(filename).writerow(row)
+            except OSError as exc:
+                print(f"[warn] {filename}: write failed: {exc}")
+                self._discard(filename)
+                continue
+            self._unflushed += 1
+            if self._unflushed >= FLUSH_ROWS or time.monotonic() - self._last_flush >= FLUSH_SECONDS:
+                self._flush()
+        for filename in list(self._handles):
+            self._discard(filename)
 
 
 class TokenWorker(threading.Thread):
@@ -889,6 +688,7 @@ class TokenWorker(threading.Thread):
         iterations: int,
         interval_seconds: int,
         stop_event: threading.Event,
+        row_writer: "RowWriter",
     ) -> None:
         super().__init__(daemon=True)
         self.token_address = token_address
@@ -899,74 +699,61 @@ class TokenWorker(threading.Thread):
         self.iterations = iterations
         self.interval_seconds = interval_seconds
         self.stop_event = stop_event
+        self.row_writer = row_writer
         self.filename = ensure_csv(token_address)
+        self._extracted: Dict[str, Tuple[Optional[Dict], Dict[str, str]]] = {}
+
+    def _extract_once(self, source: str, report: Optional[Dict], extract) -> Dict[str, str]:
+        """Reuse the previous fields while the client keeps handing back the same report object."""
+        last = self._extracted.get(source)
+        if last is not None and last[0] is report:
+            return last[1]
+        fields = extract(report)
+        self._extracted[source] = (report, fields)
+        return fields
 
     def run(self) -> None:
+        # RugCheck and CoinGecko don't depend on DexScreener, so they run alongside it.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            self._poll(pool)
+
+    def _poll(self, pool: ThreadPoolExecutor) -> None:
         for i in range(1, self.iterations + 1):
             if self.stop_event.is_set():
                 break
+            rug_future = pool.submit(self.rug_client.fetch_report, self.token_address)
+            cg_future = pool.submit(self.cg_client.fetch, self.token_address)
             pair = self.client.fetch_pair(self.token_address)
             dex_fields = extract_fields(pair) if pair else None
-            rug_report = self.rug_client.fetch_report(self.token_address)
-            rug_fields = extract_rug_fields(rug_report)
-            cg_report = self.cg_client.fetch(self.token_address)
-            cg_fields = extract_coingecko_fields(cg_report)
             tg_fields = self.tg_helper.fetch_and_analyze(dex_fields.get("telegram") if dex_fields else "NA")
+            rug_fields = self._extract_once("rug", rug_future.result(), extract_rug_fields)
+            cg_fields = self._extract_once("cg", cg_future.result(), extract_coingecko_fields)
 
             if dex_fields:
-                append_row(
-                    self.filename,
-                    self.token_address,
-                    dex_fields,
-                    rug_fields,
-                    cg_fields,
-                    tg_fields,
-                )
+                self.row_writer.submit(self.filename, build_row(self.token_address, dex_fields, rug_fields, cg_fields, tg_fields))
                 print(
                     f"[{self.token_address}] saved iteration {i}/" f"{self.iterations}: {dex_fields['price_usd']}"
                 )
             else:
                 print(f"[{self.token_address}] iteration {i}: no dex data")
 
-            if i < self.iterations:
-                # Sleep in small slices so we can react to a stop signal.
-                slept = 0
-                while slept < self.interval_seconds and not self.stop_event.is_set():
-                    time.sleep(1)
-                    slept += 1
-
-
-def prompt_token_addresses() -> List[str]:
-    while True:
-        try:
-            count = int(input("How many token addresses? (1-10): ").strip())
-        except ValueError:
-            print("Enter a number between 1 and 10.")
-            continue
-        if 1 <= count <= 10:
-            break
-        print("Number must be between 1 and 10.")
-
-    addresses: List[str] = []
-    for idx in range(count):
-        while True:
-            address = input(f"Enter token address #{idx + 1}: ").strip()
-            if address:
-                addresses.append(address)
+            # Returns as soon as the stop signal is set.
+            if i < self.iterations and self.stop_event.wait(self.interval_seconds):
                 break
-            print("Address cannot be empty.")
-    return addresses
 
 
 def main() -> None:
     token_addresses = prompt_token_addresses()
-    client = DexScreenerClient()
-    rug_client = RugCheckClient()
-    cg_client = CoinGeckoClient()
+    session = build_session()
+    client = DexScreenerClient(session)
+    rug_client = RugCheckClient(session)
+    cg_client = CoinGeckoClient(session)
 
     iterations = 6000
     interval_seconds = 13
     stop_event = threading.Event()
+    row_writer = RowWriter()
+    row_writer.start()
 
     workers = [
         TokenWorker(
@@ -974,10 +761,11 @@ def main() -> None:
             client,
             rug_client,
             cg_client,
-            TelegramSentiment(),
+            TelegramSentiment(session),
             iterations,
             interval_seconds,
             stop_event,
+            row_writer,
         )
         for addr in token_addresses
     ]
@@ -993,6 +781,7 @@ def main() -> None:
         stop_event.set()
         for worker in workers:
             worker.join()
+    row_writer.close()
 
     print("[done] all workers finished")
 
@@ -1,13 +1,32 @@
 import csv
+import itertools
+import logging
 import os
-import re
+import queue
+import sys
 import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Set
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional, Tuple
 
 import requests
-from bs4 import BeautifulSoup
+
+from scrape_common import (
+    NUM_MULTIPLIERS,
+    NUM_RE,
+    build_session,
+    extract_fields,
+    extract_rug_fields,
+    load_json,
+    message_digest,
+    parse_telegram_page,
+    project_rug_report,
+    prompt_token_addresses,
+    tally_sentiment,
+)
 
 
 FAST_HEADERS = [
@@ -59,28 +78,77 @@ FAST_HEADERS = [
 ]
 
 
+class _HttpCache:
+    """Per-key TTL cache with ETag revalidation, evicting the least recently used key past maxsize.
+
+    ``project``, when given, reduces each decoded body before it is cached and returned.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 128, project=None) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.project = project
+        self._entries: "OrderedDict[str, Tuple[float, Optional[str], object]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+
+    def get_json(self, session: requests.Session, key: str, url: str, timeout: float):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                return entry[2]
+            # Single flight: concurrent callers for the same key wait on the first caller's request.
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            data = self._fetch(session, key, url, timeout, entry)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(data)
+            return data
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def _fetch(self, session: requests.Session, key: str, url: str, timeout: float, entry):
+        headers = {"If-None-Match": entry[1]} if entry is not None and entry[1] else None
+        response = session.get(url, headers=headers, timeout=timeout)
+        if response.status_code == 304 and entry is not None:
+            etag, data = entry[1], entry[2]
+        else:
+            response.raise_for_status()
+            etag, data = response.headers.get("ETag"), load_json(response)
+            if self.project is not None:
+                data = self.project(data)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), etag, data)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return data
+
+
 class DexScreenerClient:
     """Lightweight client around the DexScreener public API."""
 
     BASE_URL = "https://api.dexscreener.com/latest/dex/tokens/{token_address}"
+    CACHE_TTL = 10.0
 
-    def __init__(self) -> None:
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
-                )
-            }
-        )
+    def __init__(self, session: Optional[requests.Session] = None) -> None:
+        self.session = session or build_session()
+        self._cache = _HttpCache(self.CACHE_TTL)
 
     def fetch_pair(self, token_address: str) -> Optional[Dict]:
         url = self.BASE_URL.format(token_address=token_address.strip())
         try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            payload = response.json()
+            payload = self._cache.get_json(self.session, token_address, url, timeout=10)
         except requests.RequestException as exc:
             print(f"[warn] {token_address}: request failed: {exc}")
             return None
@@ -99,24 +167,17 @@ class RugCheckClient:
     """Client for RugCheck token reports."""
 
     BASE_URL = "https://api.rugcheck.xyz/v1/tokens/{token_address}/report"
+    # Authorities, supply and holder split change slowly.
+    CACHE_TTL = 300.0
 
-    def __init__(self) -> None:
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
-                )
-            }
-        )
+    def __init__(self, session: Optional[requests.Session] = None) -> None:
+        self.session = session or build_session()
+        self._cache = _HttpCache(self.CACHE_TTL, project=project_rug_report)
 
     def fetch_report(self, token_address: str) -> Optional[Dict]:
         url = self.BASE_URL.format(token_address=token_address.strip())
         try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            return response.json()
+            return self._cache.get_json(self.session, token_address, url, timeout=10)
         except requests.RequestException as exc:
             print(f"[warn] {token_address}: rugcheck request failed: {exc}")
         except ValueError:
@@ -124,109 +185,16 @@ class RugCheckClient:
         return None
 
 
-# Sentiment keyword lists (simple substring matching)
-POSITIVE_WORDS = [
-    "bullish",
-    "moon",
-    "pump",
-    "buy",
-    "buying",
-    "hold",
-    "hodl",
-    "long",
-    "gem",
-    "rocket",
-    "🚀",
-    "🌙",
-    "💎",
-    "🔥",
-    "lambo",
-    "profit",
-    "gains",
-    "up",
-    "green",
-    "win",
-    "winner",
-    "strong",
-    "support",
-    "love",
-    "great",
-    "amazing",
-    "best",
-    "good",
-    "nice",
-    "awesome",
-    "excellent",
-    "perfect",
-    "bull",
-    "breakout",
-    "mooning",
-    "pumping",
-    "bullrun",
-    "ath",
-    "undervalued",
-    "potential",
-    "accumulate",
-    "bullmarket",
-    "to the moon",
-    "lets go",
-    "lfg",
-    "based",
-]
-
-
-NEGATIVE_WORDS = [
-    "bearish",
-    "dump",
-    "sell",
-    "selling",
-    "short",
-    "crash",
-    "scam",
-    "rug",
-    "rugpull",
-    "down",
-    "red",
-    "loss",
-    "lose",
-    "losing",
-    "bear",
-    "dead",
-    "shit",
-    "trash",
-    "bad",
-    "worst",
-    "terrible",
-    "avoid",
-    "warning",
-    "danger",
-    "overvalued",
-    "bubble",
-    "ponzi",
-    "fake",
-    "exit",
-    "rekt",
-    "bearmarket",
-    "falling",
-    "collapse",
-    "scam",
-]
+# Message digests remembered per channel scraper; the oldest are forgotten first.
+SEEN_MESSAGES_LIMIT = 100_000
 
 
 class TelegramSentimentScraper:
     """Integrated Telegram scraper using the existing sentiment logic."""
 
-    def __init__(self) -> None:
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
-                )
-            }
-        )
-        self.seen_messages: Set[str] = set()
+    def __init__(self, session: Optional[requests.Session] = None) -> None:
+        self.session = session or build_session()
+        self.seen_messages: "OrderedDict[int, None]" = OrderedDict()
         self.first_run = True
 
     def _normalize_username(self, telegram_field: str) -> Optional[str]:
@@ -241,16 +209,12 @@ class TelegramSentimentScraper:
     def _parse_number(self, text: str) -> int:
         if not text:
             return 0
-        text = text.strip().upper().replace(",", "")
-        match = re.search(r"([\d.]+)\s*([KMB])?", text)
+        match = NUM_RE.search(text.strip().upper().replace(",", ""))
         if not match:
             return 0
         try:
-            number = float(match.group(1))
-            suffix = match.group(2) or ""
-            multipliers = {"K": 1_000, "M": 1_000_000, "B": 1_000_000_000}
-            return int(number * multipliers.get(suffix, 1))
-        except Exception:
+            return int(float(match.group(1)) * NUM_MULTIPLIERS[match.group(2) or ""])
+        except ValueError:
             return 0
 
     def _scrape_channel(self, username: str, fetch_more: bool) -> Optional[Dict]:
@@ -272,25 +236,23 @@ class TelegramSentimentScraper:
                 print(f"[warn] telegram HTTP {resp.status_code} for {username}")
                 break
 
-            soup = BeautifulSoup(resp.content, "html.parser")
+            title, counter, texts = parse_telegram_page(resp.content, header=page == 0)
 
             if page == 0:
-                title_elem = soup.find("div", class_="tgme_channel_info_header_title")
-                if title_elem:
-                    channel_title = title_elem.get_text(strip=True)
-
-                counter_elem = soup.find("div", class_="tgme_channel_info_counter")
-                if counter_elem:
-                    subscribers = self._parse_number(counter_elem.get_text(strip=True))
+                if title:
+                    channel_title = title
+                if counter:
+                    subscribers = self._parse_number(counter)
 
-            for msg_div in soup.find_all("div", class_="tgme_widget_message_text"):
-                message_text = msg_div.get_text(strip=True)
+            for message_text in texts:
                 if not message_text:
                     continue
-                msg_id = message_text[:120]
+                msg_id = message_digest(message_text)
                 if msg_id in self.seen_messages:
                     continue
-                self.seen_messages.add(msg_id)
+                self.seen_messages[msg_id] = None
+                if len(self.seen_messages) > SEEN_MESSAGES_LIMIT:
+                    self.seen_messages.popitem(last=False)
                 messages.append(message_text)
 
             if not fetch_more:
@@ -317,22 +279,8 @@ class TelegramSentimentScraper:
                 "new_messages": 0,
             }
 
-        sentiments: List[str] = []
-        for msg in messages:
-            msg_lower = msg.lower()
-            pos_count = sum(1 for w in POSITIVE_WORDS if w in msg_lower)
-            neg_count = sum(1 for w in NEGATIVE_WORDS if w in msg_lower)
-            if pos_count > neg_count:
-                sentiments.append("positive")
-            elif neg_count > pos_count:
-                sentiments.append("negative")
-            else:
-                sentiments.append("neutral")
-
-        total = len(sentiments)
-        positive = sentiments.count("positive")
-        negative = sentiments.count("negative")
-        neutral = sentiments.count("neutral")
+        positive, negative, neutral = tally_sentiment(messages)
+        total = len(messages)
 
         def pct(part: int) -> str:
             return f"{(part / total * 100):.1f}%" if total else "0%"
@@ -395,17 +343,11 @@ class RedditSentiment:
     """Reddit search across target subs with sentiment and resilience."""
 
     SUBS = ["MemeCoins", "solana", "CryptoMoonShots"]
+    # Posts kept per sub, as when each sub was searched on its own with limit=20.
+    PER_SUB_LIMIT = 20
 
-    def __init__(self) -> None:
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
-                )
-            }
-        )
+    def __init__(self, session: Optional[requests.Session] = None) -> None:
+        self.session = session or build_session()
 
     def _analyze_posts(self, posts: List[str]) -> Dict[str, str]:
         if not posts:
@@ -420,22 +362,8 @@ class RedditSentiment:
                 "new_posts": 0,
             }
 
-        sentiments: List[str] = []
-        for body in posts:
-            body_lower = body.lower()
-            pos_count = sum(1 for w in POSITIVE_WORDS if w in body_lower)
-            neg_count = sum(1 for w in NEGATIVE_WORDS if w in body_lower)
-            if pos_count > neg_count:
-                sentiments.append("positive")
-            elif neg_count > pos_count:
-                sentiments.append("negative")
-            else:
-                sentiments.append("neutral")
-
-        total = len(sentiments)
-        positive = sentiments.count("positive")
-        negative = sentiments.count("negative")
-        neutral = sentiments.count("neutral")
+        positive, negative, neutral = tally_sentiment(posts)
+        total = len(posts)
 
         def pct(part: int) -> str:
             return f"{(part / total * 100):.1f}%" if total else "0%"
@@ -471,54 +399,58 @@ class RedditSentiment:
 
         posts: List[str] = []
         sub_counts: Dict[str, int] = {}
-
-        for sub in self.SUBS:
-            params = {
-                "q": query,
-                "sort": "new",
-                "limit": 20,
-                "t": "week",
-                "restrict_sr": True,
-            }
-            url = f"https://www.reddit.com/r/{sub}/search.json"
-            try:
-                response = self.session.get(url, params=params, timeout=10)
-                response.raise_for_status()
-                payload = response.json()
-            except requests.RequestException as exc:
-                print(f"[warn] reddit {sub} request failed: {exc}")
-                continue
-            except ValueError:
-                print(f"[warn] reddit {sub} invalid JSON")
+        taken: Dict[str, int] = {}
+
+        # One multireddit search (r/a+b+c) covers every target sub in a single request.
+        params = {
+            "q": query,
+            "sort": "new",
+            "limit": self.PER_SUB_LIMIT * len(self.SUBS),
+            "t": "week",
+            "restrict_sr": True,
+        }
+        url = f"https://www.reddit.com/r/{'+'.join(self.SUBS)}/search.json"
+        try:
+            response = self.session.get(url, params=params, timeout=10)
+            response.raise_for_status()
+            payload = load_json(response)
+        except requests.RequestException as exc:
+            print(f"[warn] reddit request failed: {exc}")
+            payload = None
+        except ValueError:
+            print("[warn] reddit invalid JSON")
+            payload = None
+
+        data_children = payload.get("data", {}).get("children", []) if isinstance(payload, dict) else []
+        for child in data_children:
+            post_data = child.get("data", {}) if isinstance(child, dict) else {}
+            # The limit covers the whole multireddit, so one busy sub could otherwise crowd out the others.
+            sub = post_data.get("subreddit")
+            if taken.get(sub, 0) >= self.PER_SUB_LIMIT:
                 continue
-
-            data_children = (
-                payload.get("data", {}).get("children", []) if isinstance(payload, dict) else []
-            )
-            for child in data_children:
-                post_data = child.get("data", {}) if isinstance(child, dict) else {}
-                title = post_data.get("title") or ""
-                selftext = post_data.get("selftext") or ""
-                created = post_data.get("created_utc")
+            taken[sub] = taken.get(sub, 0) + 1
+            title = post_data.get("title") or ""
+            selftext = post_data.get("selftext") or ""
+            created = post_data.get("created_utc")
+            timestamp = ""
+            try:
+                if created:
+                    timestamp = datetime.utcfromtimestamp(float(created)).strftime("%Y-%m-%d %H:%M:%S")
+            except (TypeError, ValueError):
                 timestamp = ""
-                try:
-                    if created:
-                        timestamp = datetime.utcfromtimestamp(float(created)).strftime("%Y-%m-%d %H:%M:%S")
-                except (TypeError, ValueError):
-                    timestamp = ""
 
-                body = f"{title} {selftext}".strip()
-                if body:
-                    combined = f"{body} {timestamp}".strip()
-                    posts.append(combined)
+            body = f"{title} {selftext}".strip()
+            if body:
+                combined = f"{body} {timestamp}".strip()
+                posts.append(combined)
 
-                if sub not in sub_counts:
-                    subs_val = post_data.get("subreddit_subscribers")
-                    try:
-                        if subs_val is not None:
-                            sub_counts[sub] = int(subs_val)
-                    except (TypeError, ValueError):
-                        continue
+            if sub and sub not in sub_counts:
+                subs_val = post_data.get("subreddit_subscribers")
+                try:
+                    if subs_val is not None:
+                        sub_counts[sub] = int(subs_val)
+                except (TypeError, ValueError):
+                    continue
 
         sentiment = self._analyze_posts(posts)
         total_subs = sum(sub_counts.values()) if sub_counts else "NA"
@@ -529,209 +461,28 @@ class RedditSentiment:
         }
 
 
-def _safe_get(data: Dict, default="NA", *keys):
-    current = data
-    for key in keys:
-        if not isinstance(current, dict):
-            return default
-        current = current.get(key, default)
-    return default if current is None else current
-
-
-def format_money(value: Optional[float]) -> str:
-    if value is None or value == 0:
-        return "NA"
-    try:
-        return f"${float(value):,.2f}"
-    except (TypeError, ValueError):
-        return "NA"
-
-
-def format_change(value: Optional[float]) -> str:
-    if value is None:
-        return "NA"
-    try:
-        return f"{float(value):.2f}%"
-    except (TypeError, ValueError):
-        return "NA"
+# Worker output goes through a queue; a listener thread formats and writes it, so workers never block on stdout.
+logger = logging.getLogger("fast_scraper")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_LOG_QUEUE: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+logger.addHandler(QueueHandler(_LOG_QUEUE))
 
 
-def extract_fields(pair_data: Dict) -> Optional[Dict[str, str]]:
-    if not pair_data:
-        return None
-
-    socials = _safe_get(pair_data, [], "info", "socials")
-    x_account = "NA"
-    telegram = "NA"
-    if isinstance(socials, list):
-        for social in socials:
-            if not isinstance(social, dict):
-                continue
-            social_type = (social.get("type") or "").lower()
-            url = social.get("url") or ""
-            if social_type == "twitter":
-                if "twitter.com/" in url:
-                    x_account = "@" + url.rsplit("/", 1)[-1]
-                elif "x.com/" in url:
-                    x_account = "@" + url.rsplit("/", 1)[-1]
-            elif social_type == "telegram":
-                if "t.me/" in url:
-                    telegram = "@" + url.rsplit("/", 1)[-1]
-                else:
-                    telegram = url
-
-    liquidity_usd = _safe_get(pair_data, 0, "liquidity", "usd")
-    liquidity_locked = "NA"
-    boosts = pair_data.get("boosts") or {}
-    if isinstance(boosts, dict) and boosts.get("active", 0) > 0:
-        liquidity_locked = "Yes"
-
-    fdv = _safe_get(pair_data, 0, "fdv")
-    market_cap = _safe_get(pair_data, 0, "marketCap")
-
-    price_usd = _safe_get(pair_data, "NA", "priceUsd")
-    try:
-        price_usd = f"${float(price_usd):.10f}" if price_usd != "NA" else "NA"
-    except (TypeError, ValueError):
-        price_usd = "NA"
-
-    price_change = _safe_get(pair_data, {}, "priceChange")
-    pair_created_at = _safe_get(pair_data, 0, "pairCreatedAt")
-    pair_age_hours = "NA"
-    if pair_created_at:
-        try:
-            created_dt = datetime.fromtimestamp(pair_created_at / 1000)
-            pair_age_hours = f"{(datetime.now() - created_dt).total_seconds() / 3600:.1f}"
-        except (TypeError, ValueError):
-            pair_age_hours = "NA"
-
-    pooled_sol = "NA"
-    quote_symbol = _safe_get(pair_data, "", "quoteToken", "symbol")
-    if quote_symbol == "SOL":
-        quote_liquidity = _safe_get(pair_data, 0, "liquidity", "quote")
-        try:
-            pooled_sol = f"{float(quote_liquidity):.2f} SOL" if quote_liquidity else "NA"
-        except (TypeError, ValueError):
-            pooled_sol = "NA"
-
-    return {
-        "name": _safe_get(pair_data, "Unknown", "baseToken", "name"),
-        "x_account": x_account,
-        "telegram": telegram,
-        "total_liquidity": format_money(liquidity_usd),
-        "liquidity_locked": liquidity_locked,
-        "fdv": format_money(fdv),
-        "market_cap": format_money(market_cap),
-        "price_usd": price_usd,
-        "m5_change": format_change(_safe_get(price_change, None, "m5")),
-        "h1_change": format_change(_safe_get(price_change, None, "h1")),
-        "h6_change": format_change(_safe_get(price_change, None, "h6")),
-        "h24_change": format_change(_safe_get(price_change, None, "h24")),
-        "pair_age": pair_age_hours,
-        "pooled_sol": pooled_sol,
-    }
-
-
-def extract_rug_fields(report: Optional[Dict]) -> Dict[str, str]:
-    if not report:
-        return {
-            "token_name": "NA",
-            "token_symbol": "NA",
-            "risk_score": "NA",
-            "risk_assessment": "NA",
-            "supply": "NA",
-            "mint_authority": "NA",
-            "freeze_authority": "NA",
-            "lp_locked_pct": "NA",
-            "top_10_pct": "NA",
-        }
+def start_log_listener() -> QueueListener:
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(_LOG_QUEUE, handler)
+    listener.start()
+    return listener
 
-    def safe_get(obj: Dict, default="NA", *keys):
-        cur = obj
-        for key in keys:
-            if not isinstance(cur, dict):
-                return default
-            cur = cur.get(key, default)
-        return default if cur is None else cur
-
-    token_name = safe_get(report, "Unknown", "tokenMeta", "name")
-    token_symbol = safe_get(report, "Unknown", "tokenMeta", "symbol")
-
-    raw_scores = [
-        safe_get(report, 0, "score"),
-        safe_get(report, 0, "aggregate", "score"),
-        safe_get(report, 0, "fileMeta", "score"),
-    ]
-    numeric_scores = [s for s in raw_scores if isinstance(s, (int, float))]
-    risk_score = min(numeric_scores) if numeric_scores else 0
-    if risk_score > 100:
-        risk_score = min(int(risk_score / 50), 100)
-
-    if risk_score <= 20:
-        risk_assessment = "Good"
-    elif risk_score <= 50:
-        risk_assessment = "Neutral"
-    elif risk_score <= 80:
-        risk_assessment = "Warning"
-    else:
-        risk_assessment = "Bad"
-
-    supply_raw = safe_get(report, 0, "token", "supply")
-    decimals = safe_get(report, 9, "token", "decimals")
-    supply = "NA"
-    try:
-        adjusted = float(supply_raw) / (10 ** int(decimals)) if supply_raw else 0
-        if adjusted >= 1_000_000_000:
-            supply = f"{adjusted/1_000_000_000:.1f}B"
-        elif adjusted >= 1_000_000:
-            supply = f"{adjusted/1_000_000:.1f}M"
-        elif adjusted > 0:
-            supply = f"{adjusted:,.0f}"
-    except (TypeError, ValueError):
-        supply = "NA"
-
-    mint_authority = safe_get(report, None, "token", "mintAuthority")
-    mint_authority = "Revoked" if not mint_authority or mint_authority == "null" else "Active"
-
-    freeze_authority = safe_get(report, None, "token", "freezeAuthority")
-    freeze_authority = "Revoked" if not freeze_authority or freeze_authority == "null" else "Active"
-
-    markets = safe_get(report, [], "markets")
-    total_lp_locked = 0.0
-    lp_count = 0
-    if isinstance(markets, list):
-        for market in markets:
-            pct = safe_get(market, 0, "lp", "lpLockedPct")
-            try:
-                pct_val = float(pct)
-                total_lp_locked += pct_val
-                lp_count += 1
-            except (TypeError, ValueError):
-                continue
-    lp_locked_pct = f"{total_lp_locked / lp_count:.2f}%" if lp_count else "0%"
 
-    top_holders = safe_get(report, [], "topHolders")
-    top_10_pct_val = 0.0
-    if isinstance(top_holders, list):
-        for holder in top_holders[:10]:
-            pct = safe_get(holder, 0, "pct")
-            try:
-                top_10_pct_val += float(pct)
-            except (TypeError, ValueError):
-                continue
-    top_10_pct = f"{top_10_pct_val:.2f}%" if top_10_pct_val else "NA"
+# Workers fetching at once; the rest wait their turn instead of all hitting the APIs together.
+MAX_CONCURRENT_FETCHES = 4
+FETCH_SEM = threading.BoundedSemaphore(MAX_CONCURRENT_FETCHES)
 
-    return {
-        "token_name": token_name,
-        "token_symbol": token_symbol,
-        "risk_score": str(risk_score) if risk_score != "NA" else "NA",
-        "risk_assessment": risk_assessment,
-        "supply": supply,
-        "mint_authority": mint_authority,
-        "freeze_authority": freeze_authority,
-        "lp_locked_pct": lp_locked_pct,
-        "top_10_pct": top_10_pct,
-    }
+# Buffered rows per worker before they are written out.
+PENDING_ROW_LIMIT = 16
 
 
 def ensure_dataset(contract_address: str) -> str:
@@ -744,65 +495,61 @@ def ensure_dataset(contract_address: str) -> str:
     return filename
 
 
-def append_row(
-    filename: str,
+def build_row(
+    timestamp: str,
     contract_address: str,
     dex_fields: Dict[str, str],
     rug_fields: Dict[str, str],
     tg_fields: Dict[str, str],
     reddit_fields: Dict[str, str],
-) -> None:
-    with open(filename, "a", newline="", encoding="utf-8") as handle:
-        writer = csv.writer(handle)
-        writer.writerow(
-            [
-                datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                contract_address,
-                dex_fields["name"],
-                dex_fields["x_account"],
-                dex_fields["telegram"],
-                dex_fields["total_liquidity"],
-                dex_fields["liquidity_locked"],
-                dex_fields["fdv"],
-                dex_fields["market_cap"],
-                dex_fields["price_usd"],
-                dex_fields["m5_change"],
-                dex_fields["h1_change"],
-                dex_fields["h6_change"],
-                dex_fields["h24_change"],
-                dex_fields["pair_age"],
-                dex_fields["pooled_sol"],
-                rug_fields["token_name"],
-                rug_fields["token_symbol"],
-                rug_fields["risk_score"],
-                rug_fields["risk_assessment"],
-                rug_fields["supply"],
-                rug_fields["mint_authority"],
-                rug_fields["freeze_authority"],
-                rug_fields["lp_locked_pct"],
-                rug_fields["top_10_pct"],
-                tg_fields["channel"],
-                tg_fields["channel_title"],
-                tg_fields["subscribers"],
-                tg_fields["messages_analyzed"],
-                tg_fields["positive"],
-                tg_fields["negative"],
-                tg_fields["neutral"],
-                tg_fields["positive_pct"],
-                tg_fields["negative_pct"],
-                tg_fields["neutral_pct"],
-                tg_fields["new_messages"],
-                reddit_fields["subs"],
-                reddit_fields["posts_analyzed"],
-                reddit_fields["positive"],
-                reddit_fields["negative"],
-                reddit_fields["neutral"],
-                reddit_fields["positive_pct"],
-                reddit_fields["negative_pct"],
-                reddit_fields["neutral_pct"],
-                reddit_fields["new_posts"],
-            ]
-        )
+) -> List[str]:
+    return [
+        timestamp,
+        contract_address,
+        dex_fields["name"],
+        dex_fields["x_account"],
+        dex_fields["telegram"],
+        dex_fields["total_liquidity"],
+        dex_fields["liquidity_locked"],
+        dex_fields["fdv"],
+        dex_fields["market_cap"],
+        dex_fields["price_usd"],
+        dex_fields["m5_change"],
+        dex_fields["h1_change"],
+        dex_fields["h6_change"],
+        dex_fields["h24_change"],
+        dex_fields["pair_age"],
+        dex_fields["pooled_sol"],
+        rug_fields["token_name"],
+        rug_fields["token_symbol"],
+        rug_fields["risk_score"],
+        rug_fields["risk_assessment"],
+        rug_fields["supply"],
+        rug_fields["mint_authority"],
+        rug_fields["freeze_authority"],
+        rug_fields["lp_locked_pct"],
+        rug_fields["top_10_pct"],
+        tg_fields["channel"],
+        tg_fields["channel_title"],
+        tg_fields["subscribers"],
+        tg_fields["messages_analyzed"],
+        tg_fields["positive"],
+        tg_fields["negative"],
+        tg_fields["neutral"],
+        tg_fields["positive_pct"],
+        tg_fields["negative_pct"],
+        tg_fields["neutral_pct"],
+        tg_fields["new_messages"],
+        reddit_fields["subs"],
+        reddit_fields["posts_analyzed"],
+        reddit_fields["positive"],
+        reddit_fields["negative"],
+        reddit_fields["neutral"],
+        reddit_fields["positive_pct"],
+        reddit_fields["negative_pct"],
+        reddit_fields["neutral_pct"],
+        reddit_fields["new_posts"],
+    ]
 
 
 class TokenWorker(threading.Thread):
@@ -822,75 +569,85 @@ class TokenWorker(threading.Thread):
         self.tg_helper = tg_helper
         self.reddit_helper = reddit_helper
         self.stop_event = stop_event
+        # Cycle numbers come from a C-level counter; self.iteration holds the latest one.
+        self._ticker = itertools.count(1)
         self.iteration = 0
         self.filename = ensure_dataset(contract_address)
+        # One handle for the worker's lifetime; rows are buffered and written in batches.
+        self._handle = open(self.filename, "a", newline="", encoding="utf-8", buffering=1 << 16)
+        self._writer = csv.writer(self._handle)
+        self._pending_rows: List[List[str]] = []
+
+    def append_row(self, row: List[str]) -> None:
+        self._pending_rows.append(row)
+        if len(self._pending_rows) >= PENDING_ROW_LIMIT:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending_rows:
+            self._writer.writerows(self._pending_rows)
+            self._pending_rows.clear()
+        self._handle.flush()
 
     def run(self) -> None:
+        try:
+            # Each cycle runs in two stages of independent requests: Dex + Rug, then Telegram + Reddit.
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                self._poll(pool)
+        finally:
+            self.flush()
+            self._handle.close()
+
+    def _poll(self, pool: ThreadPoolExecutor) -> None:
         while not self.stop_event.is_set():
             try:
-                self.iteration += 1
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                print(f"[cycle] {self.contract_address} #{self.iteration} @ {current_time}")
-
-                pair = self.client.fetch_pair(self.contract_address)
-                dex_fields = extract_fields(pair) if pair else None
-                rug_report = self.rug_client.fetch_report(self.contract_address)
-                rug_fields = extract_rug_fields(rug_report)
-                tg_fields = self.tg_helper.fetch_and_analyze(dex_fields.get("telegram") if dex_fields else "NA")
-                reddit_fields = self.reddit_helper.fetch_and_analyze(
-                    dex_fields.get("name") if dex_fields else "",
-                    rug_fields.get("token_symbol", ""),
-                )
+                self.iteration = next(self._ticker)
+                current_time = time.strftime("%Y-%m-%d %H:%M:%S")
+                logger.info("[cycle] %s #%d @ %s", self.contract_address, self.iteration, current_time)
+
+                with FETCH_SEM:
+                    rug_future = pool.submit(self.rug_client.fetch_report, self.contract_address)
+                    pair = self.client.fetch_pair(self.contract_address)
+                    dex_fields = extract_fields(pair) if pair else None
+                    rug_fields = extract_rug_fields(rug_future.result())
+
+                    tg_future = pool.submit(
+                        self.tg_helper.fetch_and_analyze, dex_fields.get("telegram") if dex_fields else "NA"
+                    )
+                    reddit_fields = self.reddit_helper.fetch_and_analyze(
+                        dex_fields.get("name") if dex_fields else "",
+                        rug_fields.get("token_symbol", ""),
+                    )
+                    tg_fields = tg_future.result()
 
                 if dex_fields:
-                    append_row(
-                        self.filename,
-                        self.contract_address,
-                        dex_fields,
-                        rug_fields,
-                        tg_fields,
-                        reddit_fields,
-                    )
-                    print(
-                        f"[{self.contract_address}] saved: {dex_fields['price_usd']}"
+                    self.append_row(
+                        build_row(
+                            current_time,
+                            self.contract_address,
+                            dex_fields,
+                            rug_fields,
+                            tg_fields,
+                            reddit_fields,
+                        )
                     )
+                    logger.info("[%s] saved: %s", self.contract_address, dex_fields["price_usd"])
                 else:
-                    print(f"[{self.contract_address}] no dex data")
+                    logger.info("[%s] no dex data", self.contract_address)
             except Exception as exc:
-                print(f"[error] {self.contract_address}: {exc}")
+                logger.error("[error] %s: %s", self.contract_address, exc)
 
-            slept = 0
-            while slept < 15 and not self.stop_event.is_set():
-                time.sleep(1)
-                slept += 1
-
-
-def prompt_token_addresses() -> List[str]:
-    while True:
-        try:
-            count = int(input("How many token addresses? (1-10): ").strip())
-        except ValueError:
-            print("Enter a number between 1 and 10.")
-            continue
-        if 1 <= count <= 10:
-            break
-        print("Number must be between 1 and 10.")
-
-    addresses: List[str] = []
-    for idx in range(count):
-        while True:
-            address = input(f"Enter token address #{idx + 1}: ").strip()
-            if address:
-                addresses.append(address)
+            if self.stop_event.wait(15):
                 break
-            print("Address cannot be empty.")
-    return addresses
 
 
 def main() -> None:
     token_addresses = prompt_token_addresses()
-    client = DexScreenerClient()
-    rug_client = RugCheckClient()
+    log_listener = start_log_listener()
+    # One pooled session for every client and worker, so TLS connections stay warm across cycles.
+    session = build_session(pool_maxsize=32)
+    client = DexScreenerClient(session)
+    rug_client = RugCheckClient(session)
 
     stop_event = threading.Event()
 
@@ -899,8 +656,8 @@ def main() -> None:
             addr,
             client,
             rug_client,
-            TelegramSentimentScraper(),
-            RedditSentiment(),
+            TelegramSentimentScraper(session),
+            RedditSentiment(session),
             stop_event,
         )
         for addr in token_addresses
@@ -918,6 +675,7 @@ def main() -> None:
         for worker in workers:
             worker.join()
 
+    log_listener.stop()
     print("[done] all workers finished")
 
 
@@ -0,0 +1,521 @@
+"""Fetching, parsing and sentiment helpers shared by dexscraper.py and fast_scraper.py."""
+
+import hashlib
+import html
+import re
+from bisect import bisect_left
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def load_json(response: requests.Response):
+    """Decode a JSON body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def body_digest(body: bytes) -> int:
+    """64-bit blake2b fingerprint of a response body or message."""
+    return int.from_bytes(hashlib.blake2b(body, digest_size=8).digest(), "little")
+
+
+# gzip/deflate, plus br/zstd when their decoders are installed.
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
+
+def build_session(pool_maxsize: int = 16) -> requests.Session:
+    """Build the keep-alive session shared by every client: compressed bodies, retries on transient failures.
+
+    ``pool_maxsize`` caps the connections kept open per host.
+    """
+    session = requests.Session()
+    session.headers.update(
+        {
+            "User-Agent": (
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+            ),
+            "Accept-Encoding": ACCEPT_ENCODING,
+            "Connection": "keep-alive",
+        }
+    )
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Parts of a RugCheck report that extract_rug_fields reads; the rest (risks, lockers, full
+# holder and market records) is dropped before the report is cached.
+_RUG_REPORT_PATHS = {
+    "tokenMeta": ("name", "symbol"),
+    "score": None,
+    "aggregate": ("score",),
+    "fileMeta": ("score",),
+    "token": ("supply", "decimals", "mintAuthority", "freezeAuthority"),
+}
+
+
+def _pick(value, keys: Tuple[str, ...]):
+    return {key: value[key] for key in keys if key in value} if isinstance(value, dict) else value
+
+
+def project_rug_report(report):
+    """Reduce a RugCheck report to the fields extract_rug_fields uses."""
+    if not isinstance(report, dict):
+        return report
+    slim = {}
+    for key, keys in _RUG_REPORT_PATHS.items():
+        if key in report:
+            slim[key] = report[key] if keys is None else _pick(report[key], keys)
+    if "markets" in report:
+        markets = report["markets"]
+        if isinstance(markets, list):
+            markets = [
+                {"lp": _pick(market.get("lp"), ("lpLockedPct",))} if isinstance(market, dict) else market
+                for market in markets
+            ]
+        slim["markets"] = markets
+    if "topHolders" in report:
+        holders = report["topHolders"]
+        if isinstance(holders, list):
+            holders = [_pick(holder, ("pct",)) for holder in holders[:10]]
+        slim["topHolders"] = holders
+    # A report with none of these fields still has to read as present.
+    return slim if slim or not report else report
+
+
+# Sentiment keyword lists (simple substring matching)
+POSITIVE_WORDS = [
+    "bullish",
+    "moon",
+    "pump",
+    "buy",
+    "buying",
+    "hold",
+    "hodl",
+    "long",
+    "gem",
+    "rocket",
+    "🚀",
+    "🌙",
+    "💎",
+    "🔥",
+    "lambo",
+    "profit",
+    "gains",
+    "up",
+    "green",
+    "win",
+    "winner",
+    "strong",
+    "support",
+    "love",
+    "great",
+    "amazing",
+    "best",
+    "good",
+    "nice",
+    "awesome",
+    "excellent",
+    "perfect",
+    "bull",
+    "breakout",
+    "mooning",
+    "pumping",
+    "bullrun",
+    "ath",
+    "undervalued",
+    "potential",
+    "accumulate",
+    "bullmarket",
+    "to the moon",
+    "lets go",
+    "lfg",
+    "based",
+]
+
+
+NEGATIVE_WORDS = [
+    "bearish",
+    "dump",
+    "sell",
+    "selling",
+    "short",
+    "crash",
+    "scam",
+    "rug",
+    "rugpull",
+    "down",
+    "red",
+    "loss",
+    "lose",
+    "losing",
+    "bear",
+    "dead",
+    "shit",
+    "trash",
+    "bad",
+    "worst",
+    "terrible",
+    "avoid",
+    "warning",
+    "danger",
+    "overvalued",
+    "bubble",
+    "ponzi",
+    "fake",
+    "exit",
+    "rekt",
+    "bearmarket",
+    "falling",
+    "collapse",
+    "scam",
+]
+
+
+def _build_keyword_automaton():
+    if ahocorasick is None:
+        return None
+    # Words listed twice keep their double weight, matching the list-scan semantics.
+    weights: Dict[str, List[int]] = {}
+    for word in POSITIVE_WORDS:
+        weights.setdefault(word, [0, 0])[0] += 1
+    for word in NEGATIVE_WORDS:
+        weights.setdefault(word, [0, 0])[1] += 1
+    automaton = ahocorasick.Automaton()
+    for word, (pos, neg) in weights.items():
+        automaton.add_word(word, (word, pos, neg))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _keyword_counts(text_lower: str) -> Tuple[int, int]:
+    """Count the distinct positive and negative keywords contained in text_lower."""
+    if _KEYWORD_AUTOMATON is None:
+        return (
+            sum(1 for w in POSITIVE_WORDS if w in text_lower),
+            sum(1 for w in NEGATIVE_WORDS if w in text_lower),
+        )
+    hits = {value for _, value in _KEYWORD_AUTOMATON.iter(text_lower)}
+    return sum(hit[1] for hit in hits), sum(hit[2] for hit in hits)
+
+
+def tally_sentiment(texts: List[str]) -> Tuple[int, int, int]:
+    """Label each text by its keyword balance and return the (positive, negative, neutral) counts."""
+    positive = negative = 0
+    for text in texts:
+        pos_count, neg_count = _keyword_counts(text.lower())
+        if pos_count > neg_count:
+            positive += 1
+        elif neg_count > pos_count:
+            negative += 1
+    return positive, negative, len(texts) - positive - negative
+
+
+_MESSAGE_TEXT_RE = re.compile(rb'<div class="tgme_widget_message_text(?: [^"]*)?"[^>]*>(.*?)</div>', re.S)
+
+
+_TAG_RE = re.compile(rb"<[^>]+>")
+
+
+def parse_telegram_page(content: bytes, header: bool) -> Tuple[Optional[str], Optional[str], List[str]]:
+    """Return (title, subscriber counter text, message texts) for a t.me/s/ preview page."""
+    if not header:
+        # Later pages only need the message bodies, which a regex pulls straight out of the markup.
+        # The lazy match ends at the first </div>, so a body with a nested div goes to the parser below.
+        blocks = _MESSAGE_TEXT_RE.findall(content)
+        if not any(b"<div" in block for block in blocks):
+            return None, None, [
+                html.unescape(_TAG_RE.sub(b"", block).decode("utf-8", "replace")).strip() for block in blocks
+            ]
+    title = counter = None
+    if HTMLParser is not None:
+        tree = HTMLParser(content)
+        if header:
+            title_node = tree.css_first("div.tgme_channel_info_header_title")
+            counter_node = tree.css_first("div.tgme_channel_info_counter")
+            title = title_node.text(separator="", strip=True) if title_node else None
+            counter = counter_node.text(separator="", strip=True) if counter_node else None
+        texts = [node.text(deep=True).strip() for node in tree.css("div.tgme_widget_message_text")]
+        return title, counter, texts
+
+    soup = BeautifulSoup(content, "html.parser")
+    if header:
+        title_elem = soup.find("div", class_="tgme_channel_info_header_title")
+        counter_elem = soup.find("div", class_="tgme_channel_info_counter")
+        title = title_elem.get_text(strip=True) if title_elem else None
+        counter = counter_elem.get_text(strip=True) if counter_elem else None
+    texts = [div.get_text().strip() for div in soup.find_all("div", class_="tgme_widget_message_text")]
+    return title, counter, texts
+
+
+NUM_RE = re.compile(r"([\d.]+)\s*([KMB])?")
+
+
+NUM_MULTIPLIERS = {"": 1, "K": 1_000, "M": 1_000_000, "B": 1_000_000_000}
+
+
+def message_digest(text: str) -> int:
+    """64-bit fingerprint of a message, used as its de-duplication key."""
+    return body_digest(text.encode("utf-8"))
+
+
+def _as_dict(value) -> Dict:
+    return value if isinstance(value, dict) else {}
+
+
+def format_money(value: Optional[float]) -> str:
+    if value is None or value == 0:
+        return "NA"
+    try:
+        return f"${float(value):,.2f}"
+    except (TypeError, ValueError):
+        return "NA"
+
+
+def format_change(value: Optional[float]) -> str:
+    if value is None:
+        return "NA"
+    try:
+        return f"{float(value):.2f}%"
+    except (TypeError, ValueError):
+        return "NA"
+
+
+# Profile links: the handle is the last path segment after the host.
+_TWITTER_URL_RE = re.compile(r"(?:twitter\.com|x\.com)/(?:.*/)?([^/]*)\Z", re.S)
+
+
+_TELEGRAM_URL_RE = re.compile(r"t\.me/(?:.*/)?([^/]*)\Z", re.S)
+
+
+def extract_fields(pair_data: Dict) -> Optional[Dict[str, str]]:
+    if not pair_data:
+        return None
+
+    get = pair_data.get
+    liquidity = _as_dict(get("liquidity"))
+    price_change = _as_dict(get("priceChange"))
+
+    socials = _as_dict(get("info")).get("socials")
+    x_account = "NA"
+    telegram = "NA"
+    if isinstance(socials, list):
+        for social in socials:
+            if not isinstance(social, dict):
+                continue
+            social_type = (social.get("type") or "").lower()
+            url = social.get("url") or ""
+            if social_type == "twitter":
+                match = _TWITTER_URL_RE.search(url)
+                if match:
+                    x_account = "@" + match.group(1)
+            elif social_type == "telegram":
+                match = _TELEGRAM_URL_RE.search(url)
+                telegram = "@" + match.group(1) if match else url
+
+    liquidity_usd = liquidity.get("usd")
+    liquidity_locked = "NA"
+    boosts = get("boosts") or {}
+    if isinstance(boosts, dict) and boosts.get("active", 0) > 0:
+        liquidity_locked = "Yes"
+
+    price_usd = get("priceUsd")
+    try:
+        price_usd = f"${float(price_usd):.10f}"
+    except (TypeError, ValueError):
+        price_usd = "NA"
+
+    pair_created_at = get("pairCreatedAt")
+    pair_age_hours = "NA"
+    if pair_created_at:
+        try:
+            created_dt = datetime.fromtimestamp(pair_created_at / 1000)
+            pair_age_hours = f"{(datetime.now() - created_dt).total_seconds() / 3600:.1f}"
+        except (TypeError, ValueError):
+            pair_age_hours = "NA"
+
+    pooled_sol = "NA"
+    if _as_dict(get("quoteToken")).get("symbol") == "SOL":
+        quote_liquidity = liquidity.get("quote")
+        try:
+            pooled_sol = f"{float(quote_liquidity):.2f} SOL" if quote_liquidity else "NA"
+        except (TypeError, ValueError):
+            pooled_sol = "NA"
+
+    name = _as_dict(get("baseToken")).get("name")
+    return {
+        "name": "Unknown" if name is None else name,
+        "x_account": x_account,
+        "telegram": telegram,
+        "total_liquidity": format_money(liquidity_usd),
+        "liquidity_locked": liquidity_locked,
+        "fdv": format_money(get("fdv")),
+        "market_cap": format_money(get("marketCap")),
+        "price_usd": price_usd,
+        "m5_change": format_change(price_change.get("m5")),
+        "h1_change": format_change(price_change.get("h1")),
+        "h6_change": format_change(price_change.get("h6")),
+        "h24_change": format_change(price_change.get("h24")),
+        "pair_age": pair_age_hours,
+        "pooled_sol": pooled_sol,
+    }
+
+
+_RISK_BOUNDS = (20, 50, 80)
+
+
+_RISK_LABELS = ("Good", "Neutral", "Warning", "Bad")
+
+
+def _rug_score(obj):
+    """Read a RugCheck ``score`` key, treating missing values as 0."""
+    score = obj.get("score") if isinstance(obj, dict) else None
+    return 0 if score is None else score
+
+
+def _parse_floats(values) -> List[float]:
+    """Floats for the values that parse; None reads as 0 and anything unparsable is dropped."""
+    parsed = []
+    for value in values:
+        try:
+            parsed.append(float(0 if value is None else value))
+        except (TypeError, ValueError):
+            continue
+    return parsed
+
+
+def extract_rug_fields(report: Optional[Dict]) -> Dict[str, str]:
+    if not report:
+        return {
+            "token_name": "NA",
+            "token_symbol": "NA",
+            "risk_score": "NA",
+            "risk_assessment": "NA",
+            "supply": "NA",
+            "mint_authority": "NA",
+            "freeze_authority": "NA",
+            "lp_locked_pct": "NA",
+            "top_10_pct": "NA",
+        }
+
+    token_meta = report.get("tokenMeta")
+    if not isinstance(token_meta, dict):
+        token_meta = {}
+    token_name = token_meta.get("name")
+    if token_name is None:
+        token_name = "Unknown"
+    token_symbol = token_meta.get("symbol")
+    if token_symbol is None:
+        token_symbol = "Unknown"
+
+    raw_scores = (
+        _rug_score(report),
+        _rug_score(report.get("aggregate")),
+        _rug_score(report.get("fileMeta")),
+    )
+    numeric_scores = [s for s in raw_scores if isinstance(s, (int, float))]
+    risk_score = min(numeric_scores) if numeric_scores else 0
+    if risk_score > 100:
+        risk_score = min(int(risk_score / 50), 100)
+    risk_assessment = _RISK_LABELS[bisect_left(_RISK_BOUNDS, risk_score)]
+
+    token = report.get("token")
+    if not isinstance(token, dict):
+        token = {}
+    supply_raw = token.get("supply")
+    decimals = token.get("decimals")
+    if decimals is None:
+        decimals = 9
+    supply = "NA"
+    try:
+        adjusted = float(supply_raw) / (10 ** int(decimals)) if supply_raw else 0
+        if adjusted >= 1_000_000_000:
+            supply = f"{adjusted/1_000_000_000:.1f}B"
+        elif adjusted >= 1_000_000:
+            supply = f"{adjusted/1_000_000:.1f}M"
+        elif adjusted > 0:
+            supply = f"{adjusted:,.0f}"
+    except (TypeError, ValueError):
+        supply = "NA"
+
+    mint_authority = token.get("mintAuthority")
+    mint_authority = "Revoked" if not mint_authority or mint_authority == "null" else "Active"
+
+    freeze_authority = token.get("freezeAuthority")
+    freeze_authority = "Revoked" if not freeze_authority or freeze_authority == "null" else "Active"
+
+    markets = report.get("markets")
+    lp_locked = []
+    if isinstance(markets, list):
+        lp_locked = _parse_floats(_as_dict(_as_dict(market).get("lp")).get("lpLockedPct") for market in markets)
+    lp_locked_pct = f"{sum(lp_locked) / len(lp_locked):.2f}%" if lp_locked else "0%"
+
+    top_holders = report.get("topHolders")
+    top_10_pct_val = 0.0
+    if isinstance(top_holders, list):
+        top_10_pct_val = sum(_parse_floats(_as_dict(holder).get("pct") for holder in top_holders[:10]))
+    top_10_pct = f"{top_10_pct_val:.2f}%" if top_10_pct_val else "NA"
+
+    return {
+        "token_name": token_name,
+        "token_symbol": token_symbol,
+        "risk_score": str(risk_score) if risk_score != "NA" else "NA",
+        "risk_assessment": risk_assessment,
+        "supply": supply,
+        "mint_authority": mint_authority,
+        "freeze_authority": freeze_authority,
+        "lp_locked_pct": lp_locked_pct,
+        "top_10_pct": top_10_pct,
+    }
+
+
+def prompt_token_addresses() -> List[str]:
+    while True:
+        try:
+            count = int(input("How many token addresses? (1-10): ").strip())
+        except ValueError:
+            print("Enter a number between 1 and 10.")
+            continue
+        if 1 <= count <= 10:
+            break
+        print("Number must be between 1 and 10.")
+
+    addresses: List[str] = []
+    for idx in range(count):
+        while True:
+            address = input(f"Enter token address #{idx + 1}: ").strip()
+            if address:
+                addresses.append(address)
+                break
+            print("Address cannot be empty.")
+    return addresses
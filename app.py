@@ -5,23 +5,44 @@ Complete API with model integration and live data scraping
 
 from flask import Flask, render_template, request, jsonify
 from flask_cors import CORS
-import pickle
-import pandas as pd
+import joblib
 import numpy as np
 import requests
 from datetime import datetime
+import atexit
 import json
+import logging
+import os
+import queue
+import sys
 import time
+from logging.handlers import QueueHandler, QueueListener
 from scraper import CoinDataScraper
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 app = Flask(__name__)
 CORS(app)
 
+# Request logging is queued and written by a listener thread, so handlers never wait on stdout
+logger = logging.getLogger("meme")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_queue = queue.SimpleQueue()
+logger.addHandler(QueueHandler(_log_queue))
+_log_handler = logging.StreamHandler(sys.stdout)
+_log_handler.setFormatter(logging.Formatter("%(message)s"))
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 # Load trained model
 print("Loading trained model...")
 try:
-    with open('smart_meme_coin_model.pkl', 'rb') as f:
-        model_package = pickle.load(f)
+    model_package = joblib.load('smart_meme_coin_model.pkl')
     
     model = model_package['model']
     label_encoder = model_package['label_encoder']
@@ -33,10 +54,40 @@ try:
 except Exception as e:
     print(f"✗ Error loading model: {e}")
     model = None
+    label_encoder = None
+    feature_columns = []
+
+# Class index -> label, resolved once instead of per request
+_CLASSES = label_encoder.classes_.tolist() if label_encoder is not None else []
+
+# Score rows on the booster directly, limited to the early-stopped trees like XGBClassifier does
+_BOOSTER = model.get_booster() if model is not None else None
+try:
+    _ITERATION_RANGE = (0, model.best_iteration + 1)
+except AttributeError:
+    _ITERATION_RANGE = (0, 0)
+
+# Column position of each model feature, so one request's features go straight into an array
+_FEAT_IDX = {name: i for i, name in enumerate(feature_columns)}
+_N_FEAT = len(feature_columns)
 
 # Initialize scraper
 scraper = CoinDataScraper()
 
+# Same key order as jsonify; numpy scalars/arrays from the model are encoded natively
+_ORJSON_OPTIONS = (orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson is not None else 0
+
+def json_response(payload):
+    """
+    Encode a JSON response with orjson when available, falling back to jsonify
+    """
+    if orjson is not None:
+        try:
+            return app.response_class(orjson.dumps(payload, option=_ORJSON_OPTIONS), mimetype='application/json')
+        except TypeError:
+            pass
+    return jsonify(payload)
+
 @app.route('/')
 def index():
     """Main coin analyzer page"""
@@ -58,35 +109,33 @@ def api_analyze():
         contract_address = data.get('contract_address', '').strip()
         
         if not contract_address:
-            return jsonify({'error': 'Contract address is required'}), 400
+            return json_response({'error': 'Contract address is required'}), 400
         
-        print(f"\n{'='*60}")
-        print(f"Analyzing coin: {contract_address}")
-        print(f"{'='*60}")
+        logger.info("\n%s\nAnalyzing coin: %s\n%s", '='*60, contract_address, '='*60)
         
         # Step 1: Scrape live data from multiple sources
-        print("\n[1/4] Scraping live data...")
+        logger.info("\n[1/4] Scraping live data...")
         coin_data = scraper.scrape_all_data(contract_address)
         
         if coin_data.get('error'):
-            return jsonify({
+            return json_response({
                 'error': coin_data['error'],
                 'message': 'Could not fetch coin data. Please check the contract address.'
             }), 404
         
-        print(f"✓ Scraped data from {len(coin_data.get('sources', []))} sources")
+        logger.info("✓ Scraped data from %d sources", len(coin_data.get('sources', [])))
         
         # Step 2: Get DexScreener graph data
-        print("\n[2/4] Fetching live chart data...")
+        logger.info("\n[2/4] Fetching live chart data...")
         graph_data = get_dexscreener_data(contract_address)
         
         # Step 3: Prepare features for model
-        print("\n[3/4] Preparing features for model...")
-        features_df = prepare_features(coin_data)
+        logger.info("\n[3/4] Preparing features for model...")
+        features = prepare_features(coin_data)
         
         # Step 4: Make prediction
-        print("\n[4/4] Generating prediction...")
-        prediction_result = make_prediction(features_df)
+        logger.info("\n[4/4] Generating prediction...")
+        prediction_result = make_prediction(features)
         
         # Prepare response
         response = {
@@ -98,14 +147,13 @@ def api_analyze():
             'timestamp': datetime.now().isoformat()
         }
         
-        print(f"\n✓ Analysis complete! Prediction: {prediction_result['signal']}")
-        print(f"{'='*60}\n")
+        logger.info("\n✓ Analysis complete! Prediction: %s\n%s\n", prediction_result['signal'], '='*60)
         
-        return jsonify(response)
+        return json_response(response)
         
     except Exception as e:
-        print(f"\n✗ Error during analysis: {str(e)}")
-        return jsonify({
+        logger.error("\n✗ Error during analysis: %s", e)
+        return json_response({
             'error': 'Analysis failed',
             'message': str(e)
         }), 500
@@ -121,7 +169,7 @@ def get_dexscreener_data(contract_address):
         response = requests.get(url, timeout=10)
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content) if orjson is not None else response.json()
             
             if data.get('pairs') and len(data['pairs']) > 0:
                 pair = data['pairs'][0]  # Get first pair
@@ -141,7 +189,7 @@ def get_dexscreener_data(contract_address):
         return {'available': False, 'message': 'No chart data available'}
         
     except Exception as e:
-        print(f"Error fetching DexScreener data: {e}")
+        logger.error("Error fetching DexScreener data: %s", e)
         return {'available': False, 'error': str(e)}
 
 def prepare_features(coin_data):
@@ -149,63 +197,65 @@ def prepare_features(coin_data):
     Prepare features from scraped data for model prediction
     """
     try:
-        # Create feature dictionary with all 107 features
-        features = {}
-        
         # Extract features from coin_data
         coingecko_data = coin_data.get('coingecko', {})
         dexscreener_data = coin_data.get('dexscreener', {})
         social_data = coin_data.get('social', {})
-        
-        # CoinGecko features
-        features['cg_price_usd'] = float(coingecko_data.get('price_usd', 0))
-        features['cg_market_cap'] = float(coingecko_data.get('market_cap', 0))
-        features['cg_market_cap_rank'] = float(coingecko_data.get('market_cap_rank', 0))
-        features['cg_fdv'] = float(coingecko_data.get('fdv', 0))
-        features['cg_total_volume_24h'] = float(coingecko_data.get('volume_24h', 0))
-        features['cg_high_24h'] = float(coingecko_data.get('high_24h', 0))
-        features['cg_low_24h'] = float(coingecko_data.get('low_24h', 0))
-        features['cg_price_change_pct_24h'] = float(coingecko_data.get('price_change_24h', 0))
-        features['cg_ath'] = float(coingecko_data.get('ath', 0))
-        features['cg_atl'] = float(coingecko_data.get('atl', 0))
-        
-        # DexScreener features
-        features['pooled_sol_scaled'] = float(dexscreener_data.get('liquidity_usd', 0)) / 1000000
-        features['market_cap_scaled'] = float(dexscreener_data.get('market_cap', 0)) / 1000000
-        
-        # Social features
-        features['tg_subscribers_scaled'] = float(social_data.get('telegram_members', 0)) / 10000
-        features['reddit_subs_scaled'] = float(social_data.get('reddit_subscribers', 0)) / 10000
-        
-        # Time-based features
         now = datetime.now()
-        features['hour_of_day'] = now.hour
-        features['day_of_week'] = now.weekday()
-        features['hour_sin'] = np.sin(2 * np.pi * now.hour / 24)
-        features['hour_cos'] = np.cos(2 * np.pi * now.hour / 24)
-        features['dow_sin'] = np.sin(2 * np.pi * now.weekday() / 7)
-        features['dow_cos'] = np.cos(2 * np.pi * now.weekday() / 7)
         
-        # Fill remaining features with zeros or defaults
-        for col in feature_columns:
-            if col not in features:
-                features[col] = 0.0
+        features = {
+            # CoinGecko features
+            'cg_price_usd': float(coingecko_data.get('price_usd', 0)),
+            'cg_market_cap': float(coingecko_data.get('market_cap', 0)),
+            'cg_market_cap_rank': float(coingecko_data.get('market_cap_rank', 0)),
+            'cg_fdv': float(coingecko_data.get('fdv', 0)),
+            'cg_total_volume_24h': float(coingecko_data.get('volume_24h', 0)),
+            'cg_high_24h': float(coingecko_data.get('high_24h', 0)),
+            'cg_low_24h': float(coingecko_data.get('low_24h', 0)),
+            'cg_price_change_pct_24h': float(coingecko_data.get('price_change_24h', 0)),
+            'cg_ath': float(coingecko_data.get('ath', 0)),
+            'cg_atl': float(coingecko_data.get('atl', 0)),
+            # DexScreener features
+            'pooled_sol_scaled': float(dexscreener_data.get('liquidity_usd', 0)) / 1000000,
+            'market_cap_scaled': float(dexscreener_data.get('market_cap', 0)) / 1000000,
+            # Social features
+            'tg_subscribers_scaled': float(social_data.get('telegram_members', 0)) / 10000,
+            'reddit_subs_scaled': float(social_data.get('reddit_subscribers', 0)) / 10000,
+            # Time-based features
+            'hour_of_day': now.hour,
+            'day_of_week': now.weekday(),
+            'hour_sin': np.sin(2 * np.pi * now.hour / 24),
+            'hour_cos': np.cos(2 * np.pi * now.hour / 24),
+            'dow_sin': np.sin(2 * np.pi * now.weekday() / 7),
+            'dow_cos': np.cos(2 * np.pi * now.weekday() / 7),
+        }
         
-        # Create DataFrame with correct column order
-        df = pd.DataFrame([features])[feature_columns]
+        # Remaining model features stay zero
+        x = np.zeros((1, _N_FEAT), dtype=np.float32)
+        for name, value in features.items():
+            idx = _FEAT_IDX.get(name)
+            if idx is not None:
+                x[0, idx] = value
         
         # Handle missing/infinite values
-        df = df.fillna(0)
-        df = df.replace([np.inf, -np.inf], 0)
+        np.nan_to_num(x, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
         
-        return df
+        return x
         
     except Exception as e:
-        print(f"Error preparing features: {e}")
-        # Return zero-filled dataframe as fallback
-        return pd.DataFrame(np.zeros((1, len(feature_columns))), columns=feature_columns)
+        logger.error("Error preparing features: %s", e)
+        # Return zero-filled row as fallback
+        return np.zeros((1, _N_FEAT), dtype=np.float32)
+
+def predict_probabilities(features):
+    """
+    Class probabilities for one prepared feature row (softmax over the booster's margins)
+    """
+    margin = _BOOSTER.inplace_predict(features, iteration_range=_ITERATION_RANGE, predict_type='margin')[0]
+    exp = np.exp(margin - margin.max())
+    return exp / exp.sum()
 
-def make_prediction(features_df):
+def make_prediction(features):
     """
     Make BUY/SELL/HOLD prediction using trained model
     """
@@ -218,20 +268,18 @@ def make_prediction(features_df):
                 'error': 'Model not loaded'
             }
         
-        # Make prediction
-        prediction = model.predict(features_df)[0]
-        probabilities = model.predict_proba(features_df)[0]
+        # Make prediction: one pass over the trees, label is the most probable class
+        probabilities = predict_probabilities(features)
+        prediction = int(np.argmax(probabilities))
         
         # Get predicted label
-        predicted_label = label_encoder.inverse_transform([prediction])[0]
+        predicted_label = _CLASSES[prediction]
         
         # Get confidence (probability of predicted class)
         confidence = float(probabilities[prediction]) * 100
         
         # Create probability dictionary
-        prob_dict = {}
-        for idx, class_name in enumerate(label_encoder.classes_):
-            prob_dict[class_name] = float(probabilities[idx]) * 100
+        prob_dict = {_CLASSES[idx]: float(p) * 100 for idx, p in enumerate(probabilities)}
         
         # Normalize prediction to uppercase
         signal = predicted_label.upper()
@@ -244,7 +292,7 @@ def make_prediction(features_df):
         }
         
     except Exception as e:
-        print(f"Error making prediction: {e}")
+        logger.error("Error making prediction: %s", e)
         return {
             'signal': 'ERROR',
             'confidence': 0.0,
@@ -274,7 +322,7 @@ def get_recommendation(signal, confidence):
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
+    return json_response({
         'status': 'healthy',
         'model_loaded': model is not None,
         'timestamp': datetime.now().isoformat()
@@ -288,4 +336,6 @@ if __name__ == '__main__':
     print(f"✓ Server starting on http://localhost:5000")
     print("="*60 + "\n")
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Debug mode's reloader imports this module twice, unpickling the model in both processes
+    debug = os.environ.get('PRODUCTION', '').lower() not in ('1', 'true', 'yes')
+    app.run(debug=debug, host='0.0.0.0', port=5000)
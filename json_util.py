@@ -0,0 +1,21 @@
+"""
+JSON helpers shared by the training and verification scripts
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def write_json(path, data):
+    """
+    Write pretty-printed JSON, with orjson (numpy-aware) when it is installed
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
@@ -1,12 +1,16 @@
 """
 Stable server runner - keeps server alive
 """
+import os
 import sys
 import time
 
 # Import the app
 from app import app
 
+# Request threads: scale with the machine, but stay small enough to avoid lock contention
+SERVER_THREADS = max(2, min(os.cpu_count() or 1, 8))
+
 if __name__ == '__main__':
     try:
         print("\n" + "="*60)
@@ -18,7 +22,7 @@ if __name__ == '__main__':
         
         # Start server in a way that keeps it alive
         from waitress import serve
-        serve(app, host='localhost', port=5000, threads=4, channel_timeout=300)
+        serve(app, host='localhost', port=5000, threads=SERVER_THREADS, channel_timeout=300)
         
     except ImportError:
         # Fallback to Flask if waitress not available
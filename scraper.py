@@ -4,20 +4,106 @@ Coin Data Scraper - Fetch live data from multiple sources
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 import json
 from datetime import datetime
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+def parse_json(response):
+    """
+    Decode a JSON response body, with orjson when it is installed
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
 
 class CoinDataScraper:
     """
     Scrapes cryptocurrency data from multiple sources
     """
     
+    # Seconds a source's result is reused for the same contract; prices move fast, CoinGecko metadata less so
+    CACHE_TTLS = {
+        'dexscreener': 30.0,
+        'coingecko': 300.0,
+        'birdeye': 30.0,
+    }
+    CACHE_SIZE = 1024
+    
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            # gzip/deflate, plus br/zstd when their decoders are installed
+            'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding']
         })
+        # Keep-alive pool sized for concurrent lookups, retrying transient upstream errors
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504])
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # One reusable simdjson parser per thread (a parser is not thread-safe)
+        self._local = threading.local()
+        # (source, contract_address) -> (fetched_at, result), least recently used first
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    def _cached(self, source, contract_address, fetch):
+        """
+        Return a source's result for a contract from the cache while fresh, otherwise fetch and store it
+        """
+        ttl = self.CACHE_TTLS.get(source)
+        if ttl is None:
+            return fetch(contract_address)
+        key = (source, contract_address)
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and time.monotonic() - entry[0] < ttl:
+                self._cache.move_to_end(key)
+                return entry[1]
+        result = fetch(contract_address)
+        # Failed lookups are not cached, so the next request retries them
+        if result:
+            with self._cache_lock:
+                self._cache[key] = (time.monotonic(), result)
+                self._cache.move_to_end(key)
+                if len(self._cache) > self.CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        return result
+    
+    def parse_lazy(self, response):
+        """
+        Parse a large JSON body with simdjson when available, so only the fields read are materialised
+        """
+        if simdjson is None:
+            return parse_json(response)
+        parser = getattr(self._local, 'parser', None)
+        if parser is None:
+            parser = self._local.parser = simdjson.Parser()
+        try:
+            return parser.parse(response.content)
+        except RuntimeError:
+            # A value from this thread's previous document is still referenced; start a fresh parser
+            parser = self._local.parser = simdjson.Parser()
+            return parser.parse(response.content)
     
     def scrape_all_data(self, contract_address):
         """
@@ -32,33 +118,21 @@ class CoinDataScraper:
                 'sources': []
             }
             
-            # 1. DexScreener
-            print("  → Scraping DexScreener...")
-            dexscreener_data = self.scrape_dexscreener(contract_address)
-            if dexscreener_data:
-                data['dexscreener'] = dexscreener_data
-                data['sources'].append('dexscreener')
-            
-            # 2. CoinGecko (if available)
-            print("  → Scraping CoinGecko...")
-            coingecko_data = self.scrape_coingecko(contract_address)
-            if coingecko_data:
-                data['coingecko'] = coingecko_data
-                data['sources'].append('coingecko')
-            
-            # 3. Birdeye
-            print("  → Scraping Birdeye...")
-            birdeye_data = self.scrape_birdeye(contract_address)
-            if birdeye_data:
-                data['birdeye'] = birdeye_data
-                data['sources'].append('birdeye')
-            
-            # 4. Social data
-            print("  → Fetching social data...")
-            social_data = self.get_social_data(contract_address)
-            if social_data:
-                data['social'] = social_data
-                data['sources'].append('social')
+            # All sources are I/O-bound, so fetch them concurrently and merge in a fixed order
+            sources = (
+                ('dexscreener', self.scrape_dexscreener),
+                ('coingecko', self.scrape_coingecko),
+                ('birdeye', self.scrape_birdeye),
+                ('social', self.get_social_data),
+            )
+            print("  → Scraping DexScreener, CoinGecko, Birdeye and social data...")
+            with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+                futures = [(name, executor.submit(self._cached, name, contract_address, fetch)) for name, fetch in sources]
+                for name, future in futures:
+                    result = future.result()
+                    if result:
+                        data[name] = result
+                        data['sources'].append(name)
             
             if len(data['sources']) == 0:
                 return {'error': 'No data found for this contract address'}
@@ -79,31 +153,37 @@ class CoinDataScraper:
             response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
+                data = self.parse_lazy(response)
                 
                 if data.get('pairs') and len(data['pairs']) > 0:
                     pair = data['pairs'][0]
+                    # Bind each nested object once instead of re-walking it per field
+                    base_token = pair.get('baseToken', {})
+                    price_change = pair.get('priceChange', {})
+                    volume = pair.get('volume', {})
+                    liquidity = pair.get('liquidity', {})
+                    txns_24h = pair.get('txns', {}).get('h24', {})
                     
                     return {
-                        'name': pair.get('baseToken', {}).get('name', 'Unknown'),
-                        'symbol': pair.get('baseToken', {}).get('symbol', 'Unknown'),
+                        'name': base_token.get('name', 'Unknown'),
+                        'symbol': base_token.get('symbol', 'Unknown'),
                         'price_usd': pair.get('priceUsd', 0),
-                        'price_change_24h': pair.get('priceChange', {}).get('h24', 0),
-                        'price_change_6h': pair.get('priceChange', {}).get('h6', 0),
-                        'price_change_1h': pair.get('priceChange', {}).get('h1', 0),
-                        'volume_24h': pair.get('volume', {}).get('h24', 0),
-                        'volume_6h': pair.get('volume', {}).get('h6', 0),
-                        'liquidity_usd': pair.get('liquidity', {}).get('usd', 0),
-                        'liquidity_base': pair.get('liquidity', {}).get('base', 0),
-                        'liquidity_quote': pair.get('liquidity', {}).get('quote', 0),
+                        'price_change_24h': price_change.get('h24', 0),
+                        'price_change_6h': price_change.get('h6', 0),
+                        'price_change_1h': price_change.get('h1', 0),
+                        'volume_24h': volume.get('h24', 0),
+                        'volume_6h': volume.get('h6', 0),
+                        'liquidity_usd': liquidity.get('usd', 0),
+                        'liquidity_base': liquidity.get('base', 0),
+                        'liquidity_quote': liquidity.get('quote', 0),
                         'fdv': pair.get('fdv', 0),
                         'market_cap': pair.get('marketCap', 0),
                         'pair_address': pair.get('pairAddress', ''),
                         'pair_created_at': pair.get('pairCreatedAt', 0),
                         'dex_id': pair.get('dexId', ''),
                         'chain': pair.get('chainId', ''),
-                        'txns_24h_buys': pair.get('txns', {}).get('h24', {}).get('buys', 0),
-                        'txns_24h_sells': pair.get('txns', {}).get('h24', {}).get('sells', 0),
+                        'txns_24h_buys': txns_24h.get('buys', 0),
+                        'txns_24h_sells': txns_24h.get('sells', 0),
                         'url': pair.get('url', '')
                     }
             
@@ -124,7 +204,7 @@ class CoinDataScraper:
             response = self.session.get(search_url, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
+                data = self.parse_lazy(response)
                 
                 market_data = data.get('market_data', {})
                 
@@ -166,7 +246,7 @@ class CoinDataScraper:
             response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 
                 if data.get('success') and data.get('data'):
                     token_data = data['data']
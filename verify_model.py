@@ -2,10 +2,11 @@
 Verify and test the trained Smart Meme Coin model
 """
 
+import joblib
 import pickle
-import json
 import pandas as pd
 import numpy as np
+from json_util import write_json
 
 print("="*80)
 print("SMART MEME COIN - MODEL VERIFICATION")
@@ -14,8 +15,7 @@ print("="*80)
 # Load the model package
 print("\n📦 Loading model package...")
 try:
-    with open('smart_meme_coin_model.pkl', 'rb') as f:
-        model_package = pickle.load(f)
+    model_package = joblib.load('smart_meme_coin_model.pkl')
     print("✓ Model package loaded successfully!")
 except Exception as e:
     print(f"✗ Error loading model: {e}")
@@ -25,6 +25,7 @@ except Exception as e:
 model = model_package['model']
 label_encoder = model_package['label_encoder']
 feature_columns = model_package['feature_columns']
+feature_medians = model_package.get('feature_medians')
 training_info = model_package['training_info']
 
 # Display model information
@@ -65,11 +66,10 @@ metadata = {
         'train_samples': training_info['train_samples'],
         'test_samples': training_info['test_samples']
     },
-    'model_parameters': {k: str(v) for k, v in training_info['model_params'].items()}
+    'model_parameters': training_info['model_params']
 }
 
-with open('model_metadata.json', 'w') as f:
-    json.dump(metadata, f, indent=2)
+write_json('model_metadata.json', metadata)
 print("✓ model_metadata.json created")
 
 # Save label encoder separately
@@ -78,8 +78,7 @@ with open('label_encoder.pkl', 'wb') as f:
 print("✓ label_encoder.pkl created")
 
 # Save feature columns
-with open('feature_columns.json', 'w') as f:
-    json.dump(feature_columns, f, indent=2)
+write_json('feature_columns.json', feature_columns)
 print("✓ feature_columns.json created")
 
 # Save XGBoost booster
@@ -97,13 +96,25 @@ print(f"✓ Loaded {len(df_test)} test samples")
 
 # Prepare test features
 exclude_cols = ['label', 'contract_address', 'timestamp']
-X_test_sample = df_test[feature_columns].head(10)
-X_test_sample = X_test_sample.fillna(X_test_sample.median())
-X_test_sample = X_test_sample.replace([np.inf, -np.inf], np.nan)
-X_test_sample = X_test_sample.fillna(X_test_sample.median())
-
-# Make predictions
-predictions = model.predict(X_test_sample)
+X_test_sample = df_test[feature_columns].head(10).to_numpy(dtype=np.float32)
+# Non-finite cells take the training medians (packages saved before they were stored: the sample's own)
+bad_mask = ~np.isfinite(X_test_sample)
+if bad_mask.any():
+    if feature_medians is not None:
+        medians = np.array([feature_medians[col] for col in feature_columns], dtype=np.float32)
+    else:
+        medians = np.nanmedian(np.where(bad_mask, np.nan, X_test_sample), axis=0)
+    rows, cols = np.nonzero(bad_mask)
+    X_test_sample[rows, cols] = medians[cols]
+
+# Make predictions straight on the booster (no DMatrix), up to the early-stopped iteration
+booster = model.get_booster()
+try:
+    iteration_range = (0, model.best_iteration + 1)
+except AttributeError:
+    iteration_range = (0, 0)
+raw = booster.inplace_predict(X_test_sample, iteration_range=iteration_range)
+predictions = raw.argmax(axis=1) if raw.ndim == 2 else raw.astype(int)
 predicted_labels = label_encoder.inverse_transform(predictions)
 actual_labels = df_test['label'].head(10).values
 
@@ -127,12 +138,11 @@ print("""
 
 💡 Usage Example:
    
-   import pickle
+   import joblib
    import pandas as pd
    
    # Load model
-   with open('smart_meme_coin_model.pkl', 'rb') as f:
-       model_pkg = pickle.load(f)
+   model_pkg = joblib.load('smart_meme_coin_model.pkl')
    
    model = model_pkg['model']
    label_encoder = model_pkg['label_encoder']